@@ -0,0 +1,94 @@
+"""Tests for reading and updating post directories in generate.add."""
+
+import os
+import time
+
+from vbsocial.generate import add
+from vbsocial.generate.add import get_existing_components, list_names, load_post_yaml, update_post_yaml
+
+
+class TestPostYaml:
+    """Tests for loading and writing post.yaml."""
+    
+    def test_rewrite_in_same_second_is_reread(self, tmp_path):
+        """A same-size rewrite that keeps the mtime is not served from the cache."""
+        yaml_path = tmp_path / "post.yaml"
+        update_post_yaml(tmp_path, ["idea"], {"title": "Ramp"})
+        assert load_post_yaml(tmp_path)["components"] == ["idea"]
+        first = yaml_path.stat()
+        
+        update_post_yaml(tmp_path, ["rust"], {"title": "Ramp"})
+        os.utime(yaml_path, ns=(first.st_atime_ns, first.st_mtime_ns))
+        assert yaml_path.stat().st_size == first.st_size
+        
+        assert load_post_yaml(tmp_path)["components"] == ["rust"]
+    
+    def test_settled_file_parsed_once(self, tmp_path, monkeypatch):
+        """A file last modified a while ago is parsed once and then cached."""
+        yaml_path = tmp_path / "post.yaml"
+        update_post_yaml(tmp_path, ["idea"], {"title": "Ramp"})
+        hour_ago = time.time_ns() - 3600 * 10**9
+        os.utime(yaml_path, ns=(hour_ago, hour_ago))
+        parses = []
+        real_load = add._load_yaml
+        monkeypatch.setattr(add, "_load_yaml", lambda path: parses.append(path) or real_load(path))
+        
+        first = load_post_yaml(tmp_path)
+        first["title"] = "changed by caller"
+        assert load_post_yaml(tmp_path)["title"] == "Ramp"
+        assert len(parses) == 1
+    
+    def test_unchanged_content_not_rewritten(self, tmp_path):
+        """Writing the same components again leaves the file and its mtime alone."""
+        yaml_path = tmp_path / "post.yaml"
+        config = {"title": "Ramp", "captions": {"x": "line one\nline two"}}
+        update_post_yaml(tmp_path, ["problem", "idea"], dict(config))
+        hour_ago = time.time_ns() - 3600 * 10**9
+        os.utime(yaml_path, ns=(hour_ago, hour_ago))
+        
+        update_post_yaml(tmp_path, ["problem", "idea"], dict(config))
+        assert yaml_path.stat().st_mtime_ns == hour_ago
+        
+        update_post_yaml(tmp_path, ["problem", "idea", "rust"], dict(config))
+        assert yaml_path.stat().st_mtime_ns != hour_ago
+        assert load_post_yaml(tmp_path)["components"] == ["problem", "idea", "rust"]
+    
+    def test_round_trip_keeps_multiline_captions(self, tmp_path):
+        """Multiline captions are written as literal blocks and read back intact."""
+        caption = "First line\nSecond line: with a colon\n"
+        update_post_yaml(tmp_path, ["problem"], {"captions": {"instagram": caption}})
+        
+        assert "instagram: |" in (tmp_path / "post.yaml").read_text()
+        assert load_post_yaml(tmp_path)["captions"]["instagram"] == caption
+    
+    def test_missing_file(self, tmp_path):
+        """A post without post.yaml loads as empty."""
+        assert load_post_yaml(tmp_path) == {}
+
+
+class TestExistingComponents:
+    """Tests for detecting components from the files in a post directory."""
+    
+    def test_tex_then_languages_in_fixed_order(self, tmp_path):
+        """Order follows the slide order and language preference, not the directory listing."""
+        for name in ("diagram.tex", "datamodel.go", "problem.tex", "datamodel.rs", "idea.tex"):
+            (tmp_path / name).write_text("x")
+        
+        assert get_existing_components(tmp_path) == ["problem", "idea", "diagram", "rust", "go"]
+    
+    def test_unrelated_files_ignored(self, tmp_path):
+        """Other files, unknown data model extensions and near-miss names don't count."""
+        for name in ("main.tex", "post.yaml", "datamodel.java", "datamodel", "problem.tex.bak", "solution.tex"):
+            (tmp_path / name).write_text("x")
+        
+        assert get_existing_components(tmp_path) == ["solution"]
+    
+    def test_uses_given_listing(self, tmp_path):
+        """A listing passed in is used instead of scanning the directory again."""
+        (tmp_path / "problem.tex").write_text("x")
+        names = list_names(tmp_path)
+        (tmp_path / "idea.tex").write_text("x")
+        
+        assert names == {"problem.tex"}
+        assert get_existing_components(tmp_path, names) == ["problem"]
+        assert get_existing_components(tmp_path) == ["problem", "idea"]
@@ -0,0 +1,118 @@
+"""Tests for agent helpers that fan calls out to worker threads."""
+
+import asyncio
+import sys
+import threading
+from types import ModuleType, SimpleNamespace
+
+import pytest
+from click.testing import CliRunner
+
+from vbsocial.agents import caption, datamodel, tikz
+from vbsocial.generate.add import add_component
+
+
+def _install(monkeypatch, name: str, **attrs) -> None:
+    module = ModuleType(name)
+    module.__dict__.update(attrs)
+    monkeypatch.setitem(sys.modules, name, module)
+
+
+@pytest.fixture
+def stub_runner(monkeypatch):
+    """Replace vbagent's runner with one that needs the thread's event loop.
+    
+    Like older agent SDK runners, it calls asyncio.get_event_loop(), which
+    raises in a worker thread that has no loop set.
+    """
+    threads = []
+    
+    async def respond(agent):
+        threads.append(threading.current_thread())
+        if agent.output_type is None:
+            return f"```rust\nstruct {agent.name};\n```"
+        return agent.output_type(**{name: f"{agent.name} {name}" for name in agent.output_type.model_fields})
+    
+    def run_agent_sync(agent, input_text):
+        return asyncio.get_event_loop().run_until_complete(respond(agent))
+    
+    def create_agent(output_type=None, **kwargs):
+        return SimpleNamespace(output_type=output_type, **kwargs)
+    
+    _install(monkeypatch, "vbagent")
+    _install(monkeypatch, "vbagent.agents")
+    _install(monkeypatch, "vbagent.agents.base", create_agent=create_agent, run_agent_sync=run_agent_sync)
+    _install(monkeypatch, "agents")
+    _install(monkeypatch, "agents.model_settings", ModelSettings=SimpleNamespace, Reasoning=SimpleNamespace)
+    caption._settings_for.cache_clear()
+    yield threads
+    caption._settings_for.cache_clear()
+
+
+class TestDatamodelPrompts:
+    """Tests for the datamodel system prompts."""
+    
+    @pytest.mark.parametrize("language, persona", [
+        ("rust", "You are a Rust architect."),
+        ("go", "You are a Go developer."),
+    ])
+    def test_persona_leads_prompt(self, language, persona):
+        """The persona line opens the prompt; shared rules precede the language rules."""
+        prompt = datamodel.get_language_prompt(language)
+        assert prompt.startswith(f"{persona} Generate a concise data model for physics problems.\n\n")
+        assert prompt.index(datamodel.BASE_RULES) < prompt.index(" Specific\n")
+        assert "- You are a" not in prompt
+
+
+@pytest.fixture
+def post_dir(tmp_path):
+    """A minimal post directory with a problem and solution."""
+    (tmp_path / "problem.tex").write_text("A block slides down a ramp.")
+    (tmp_path / "solution.tex").write_text("Use energy conservation.")
+    return tmp_path
+
+
+class TestWorkerThreads:
+    """Tests that agent calls work off the main thread."""
+    
+    def test_captions_from_post_in_workers(self, tmp_path, stub_runner):
+        """Physics and code captions both run on pool threads and combine."""
+        (tmp_path / "problem.tex").write_text("A block slides down a ramp.")
+        (tmp_path / "datamodel.rs").write_text("struct Block {\n    mass: f64,\n}\n")
+        
+        captions = caption.generate_captions_from_post(str(tmp_path))
+        
+        assert captions["facebook"].startswith("PhysicsCaptionAgent facebook")
+        assert "CodeCaptionAgent facebook" in captions["facebook"]
+        assert len(stub_runner) == 2
+        assert threading.main_thread() not in stub_runner
+    
+    def test_datamodels_batch_in_workers(self, stub_runner):
+        """Every language runs on a pool thread and comes back fence-stripped, in order."""
+        models = datamodel.generate_datamodels_batch("A block slides down a ramp.", ["swift", "rust", "go"])
+        
+        assert list(models) == ["swift", "rust", "go"]
+        assert models["rust"] == "struct RustDataModelAgent;"
+        assert len(stub_runner) == 3
+        assert threading.main_thread() not in stub_runner
+    
+    def test_add_code_in_worker(self, post_dir, stub_runner):
+        """vbsocial add runs the datamodel agent on a pool thread and saves it."""
+        result = CliRunner().invoke(add_component, [str(post_dir), "--code", "rust"])
+        
+        assert result.exit_code == 0, result.output
+        assert (post_dir / "datamodel.rs").read_text() == "struct RustDataModelAgent;"
+        assert threading.main_thread() not in stub_runner
+    
+    def test_add_reports_shared_failure_once(self, post_dir, monkeypatch):
+        """Jobs failing with the same error produce one line naming them all."""
+        def fail(**kwargs):
+            raise RuntimeError("invalid API key")
+        
+        monkeypatch.setattr(datamodel, "generate_datamodel", fail)
+        monkeypatch.setattr(tikz, "generate_tikz", fail)
+        result = CliRunner().invoke(add_component, [str(post_dir), "--code", "rust", "--tikz"])
+        
+        assert result.exit_code == 0, result.output
+        assert "diagram.tex, datamodel.rs all failed with the same error: invalid API key" in result.output
+        assert "❌ Failed" not in result.output
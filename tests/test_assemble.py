@@ -0,0 +1,41 @@
+"""Tests for assemble's component previews."""
+
+import pytest
+
+from vbsocial.generate.assemble import preview_content
+
+
+def strip_preview(content: str, head: int = 30, tail: int = 30) -> str:
+    """The straightforward strip-and-slice version preview_content must match."""
+    content = content.strip()
+    if len(content) <= head + tail + 10:
+        return content
+    return f"{content[:head]}...{content[-tail:]}"
+
+
+class TestPreviewContent:
+    """Tests for the index-based preview truncation."""
+    
+    @pytest.mark.parametrize("content", [
+        "",
+        " \n\t ",
+        "short",
+        "  \\begin{itemize} \\item x \\end{itemize}\n\n",
+        "a" * 70,
+        "a" * 71,
+        "\n\n" + "b" * 69 + "\u00a0\u2003",
+        "\t" + "".join(chr(ord("a") + i % 26) for i in range(500)) + "\n\n",
+        "x" + " " * 200 + "y",
+    ])
+    def test_matches_strip_and_slice(self, content):
+        """Same result as stripping the whole string, including at the length boundary."""
+        assert preview_content(content) == strip_preview(content)
+    
+    def test_truncates_long_content(self):
+        """Long content keeps head and tail around an ellipsis, ignoring outer whitespace."""
+        content = "\n  " + "H" * 30 + "m" * 100 + "T" * 30 + "  \n"
+        assert preview_content(content) == "H" * 30 + "..." + "T" * 30
+    
+    def test_custom_lengths(self):
+        """head and tail control the kept ends."""
+        assert preview_content("0123456789" * 5, head=3, tail=2) == "012...89"
@@ -1,6 +1,8 @@
 """Tests for common utilities."""
 
 import json
+import os
+import stat
 import tempfile
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -8,8 +10,11 @@ from unittest.mock import patch, MagicMock
 import pytest
 
 from vbsocial.common.config import save_json, load_json, ensure_dir
+from vbsocial.common.files import read_text_cached, read_text_fd, write_text_fd
 from vbsocial.common.auth import TokenManager, ConfigManager
-from vbsocial.common.http import create_session, with_retry
+from vbsocial.common.http import create_session, extract_error, with_retry
+from vbsocial.common import llm_cache
+from vbsocial.common.markdown import strip_code_fence
 
 
 class TestConfig:
@@ -36,6 +41,115 @@ class TestConfig:
         new_dir = tmp_path / "new" / "nested" / "dir"
         ensure_dir(new_dir)
         assert new_dir.exists()
+    
+    def test_ensure_dir_tightens_existing_directory(self, tmp_path):
+        """An existing directory with loose permissions is reset to 700."""
+        loose = tmp_path / "tokens"
+        loose.mkdir(mode=0o755)
+        loose.chmod(0o755)
+        ensure_dir(loose)
+        assert stat.S_IMODE(loose.stat().st_mode) == stat.S_IRWXU
+
+
+class TestFiles:
+    """Tests for file I/O helpers."""
+    
+    def test_read_text_fd_decodes_utf8(self, tmp_path):
+        """Multi-byte text and empty files read back exactly."""
+        path = tmp_path / "slide.tex"
+        path.write_bytes("θ = ωt — \\alpha\n".encode("utf-8"))
+        assert read_text_fd(path) == "θ = ωt — \\alpha\n"
+        
+        empty = tmp_path / "empty.tex"
+        empty.touch()
+        assert read_text_fd(empty) == ""
+    
+    def test_read_text_cached_same_tick_rewrite(self, tmp_path):
+        """A same-size rewrite that keeps the mtime is read fresh."""
+        path = tmp_path / "problem.tex"
+        path.write_text("mass m")
+        assert read_text_cached(path) == "mass m"
+        first = path.stat()
+        
+        path.write_text("mass M")
+        os.utime(path, ns=(first.st_atime_ns, first.st_mtime_ns))
+        assert read_text_cached(path) == "mass M"
+        assert read_text_cached(tmp_path / "missing.tex") == ""
+    
+    def test_write_text_fd_truncates(self, tmp_path):
+        """Rewriting with shorter content leaves no trailing bytes."""
+        path = tmp_path / "main.tex"
+        write_text_fd(path, "\\documentclass{article} % long θ line\n")
+        write_text_fd(path, "short\n")
+        assert path.read_bytes() == b"short\n"
+
+
+class TestStripCodeFence:
+    """Tests for extracting code from markdown fences."""
+    
+    def test_tagged_fence(self):
+        """The language tag is dropped and surrounding prose ignored."""
+        text = "Here you go:\n```rust\nfn main() {}\n```\nDone."
+        assert strip_code_fence(text) == "fn main() {}"
+    
+    def test_untagged_fence(self):
+        """A fence without a tag returns its whole body."""
+        assert strip_code_fence("```\nx = 1\ny = 2\n```") == "x = 1\ny = 2"
+    
+    @pytest.mark.parametrize("text, body", [
+        ("```x = 1```", "x = 1"),
+        ("```code```", "code"),
+        ("```print(1) ```", "print(1)"),
+    ])
+    def test_one_line_fence_keeps_first_word(self, text, body):
+        """Without a newline after it, the first word is code, not a tag."""
+        assert strip_code_fence(text) == body
+    
+    def test_unterminated_fence(self):
+        """A fence cut off by the token limit runs to the end."""
+        assert strip_code_fence("```python\ndef f():\n    return 1\n") == "def f():\n    return 1"
+    
+    def test_no_fence(self):
+        """Plain output is returned stripped."""
+        assert strip_code_fence("  \\draw (0,0);\n") == "\\draw (0,0);"
+    
+    def test_preferred_tag_wins(self):
+        """A block tagged with a preferred language beats an earlier block."""
+        text = "```text\nnotes\n```\n```tikz\n\\draw (0,0);\n```"
+        assert strip_code_fence(text, ("tikz", "latex")) == "\\draw (0,0);"
+        assert strip_code_fence(text) == "notes"
+
+
+class TestLlmCache:
+    """Tests for the LLM response cache."""
+    
+    def test_cached_run_reuses_response(self, tmp_path, monkeypatch):
+        """Same inputs within the TTL hit the cache; new input misses."""
+        monkeypatch.setattr(llm_cache, "CACHE_DIR", tmp_path)
+        calls = []
+        
+        def runner():
+            calls.append(1)
+            return f"output {len(calls)}"
+        
+        assert llm_cache.cached_run("agent", "input", "model", runner, ttl=60) == "output 1"
+        assert llm_cache.cached_run("agent", "input", "model", runner, ttl=60) == "output 1"
+        assert llm_cache.cached_run("agent", "other", "model", runner, ttl=60) == "output 2"
+    
+    def test_cached_run_disabled_by_default(self, tmp_path, monkeypatch):
+        """Without a TTL every call runs the agent."""
+        monkeypatch.setattr(llm_cache, "CACHE_DIR", tmp_path)
+        monkeypatch.delenv("VBSOCIAL_LLM_CACHE_TTL", raising=False)
+        calls = []
+        
+        def runner():
+            calls.append(1)
+            return "output"
+        
+        llm_cache.cached_run("agent", "input", "model", runner)
+        llm_cache.cached_run("agent", "input", "model", runner)
+        assert len(calls) == 2
+        assert not list(tmp_path.iterdir())
 
 
 class TestTokenManager:
@@ -122,3 +236,31 @@ class TestHttpSession:
             always_fails()
         
         assert call_count == 3
+    
+    def test_with_retry_backoff_capped_with_jitter(self):
+        """Retry sleeps grow exponentially, are capped, and add bounded jitter."""
+        @with_retry(max_attempts=4, delay=1.0, backoff=10.0, max_delay=5.0,
+                    jitter=0.5, exceptions=(ValueError,))
+        def always_fails():
+            raise ValueError("permanent error")
+        
+        with patch("vbsocial.common.http.time.sleep") as mock_sleep:
+            with pytest.raises(ValueError):
+                always_fails()
+        
+        sleeps = [c.args[0] for c in mock_sleep.call_args_list]
+        assert len(sleeps) == 3
+        assert 1.0 <= sleeps[0] <= 1.5
+        assert 5.0 <= sleeps[1] <= 7.5
+        assert 5.0 <= sleeps[2] <= 7.5
+    
+    def test_extract_error(self):
+        """Error messages come from the JSON body, else the raw text."""
+        def response(content: bytes) -> MagicMock:
+            resp = MagicMock(status_code=400, content=content, text=content.decode())
+            resp.json.side_effect = lambda: json.loads(content)
+            return resp
+        
+        assert extract_error(response(b'{"error": {"message": "Bad token"}}')) == "Bad token"
+        assert extract_error(response(b'{"message": "Slow down"}')) == "Slow down"
+        assert extract_error(response(b"<html>oops</html>")) == "<html>oops</html>"
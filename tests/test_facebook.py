@@ -0,0 +1,180 @@
+"""Tests for Facebook auth and upload helpers."""
+
+import json
+import time
+from unittest.mock import MagicMock, patch
+
+import click
+import pytest
+import requests
+
+from vbsocial.common.auth import ConfigManager
+from vbsocial.facebook import auth
+from vbsocial.facebook._api import StreamingMultipart
+
+
+@pytest.fixture
+def fb_config(tmp_path, monkeypatch):
+    """Point the Facebook config at a temp file and reset the in-process caches."""
+    manager = ConfigManager("facebook")
+    manager.config_file = tmp_path / "config.json"
+    monkeypatch.setattr(auth, "_config_manager", manager)
+    monkeypatch.setattr(auth, "_CONFIG_CACHE", None)
+    monkeypatch.setattr(auth, "_CONFIG_MTIME", None)
+    auth._invalidate_token_cache()
+    manager.save({"access_token": "old", "page_id": "1"})
+    yield manager
+    auth._invalidate_token_cache()
+
+
+def make_response(status: int, body) -> requests.Response:
+    """Build a requests.Response with a JSON body."""
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(body).encode()
+    response.headers["Content-Type"] = "application/json"
+    return response
+
+
+@pytest.fixture
+def refreshable(fb_config):
+    """A config that can refresh, with an expiry far enough out to be trusted unprobed."""
+    fb_config.save({
+        "access_token": "old",
+        "app_id": "app",
+        "app_secret": "secret",
+        "token_expiry": time.time() + 86400,
+    })
+    return fb_config
+
+
+class TestConfigCache:
+    """Tests for the in-memory config.json cache."""
+    
+    def test_load_returns_private_copy(self, fb_config):
+        """Editing a loaded config doesn't leak into the next load."""
+        config = auth.load_config()
+        config["access_token"] = "edited"
+        assert auth.load_config()["access_token"] == "old"
+    
+    def test_failed_save_keeps_cache(self, fb_config):
+        """A token that never reached disk is not served from the cache."""
+        config = auth.load_config()
+        config["access_token"] = "new"
+        with patch.object(fb_config, "save", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                auth.save_config(config)
+        assert auth.load_config()["access_token"] == "old"
+    
+    def test_save_updates_cache(self, fb_config):
+        """A successful save is visible to the next load, decoupled from the caller's dict."""
+        config = auth.load_config()
+        config["access_token"] = "new"
+        auth.save_config(config)
+        config["access_token"] = "changed after save"
+        assert auth.load_config()["access_token"] == "new"
+
+
+class TestTokenRefresh:
+    """Tests for refreshing a token the Graph API rejected."""
+    
+    def workflow(self):
+        """A Graph API call that fails with code 190 until the token is refreshed."""
+        tokens = []
+        
+        @auth.refresh_on_token_error
+        def post():
+            token = auth.get_access_token()
+            tokens.append(token)
+            if token == "old":
+                auth.check_token_error(make_response(400, {"error": {"code": 190, "message": "expired"}}))
+            return "posted"
+        
+        return post, tokens
+    
+    def test_refreshes_once_then_succeeds(self, refreshable):
+        """A rejected token is refreshed once and the call retried with the new token."""
+        session = MagicMock()
+        session.get.return_value = make_response(200, {"access_token": "new", "expires_in": 3600})
+        auth.cache_page_token("page", "old", "stale page token")
+        post, tokens = self.workflow()
+        
+        with patch.object(auth, "get_session", return_value=session):
+            assert post() == "posted"
+        
+        assert tokens == ["old", "new"]
+        session.get.assert_called_once()
+        assert session.get.call_args.kwargs["params"]["fb_exchange_token"] == "old"
+        assert refreshable.load()["access_token"] == "new"
+        assert auth.get_cached_page_token("page", "old") is None
+    
+    def test_refresh_failure_propagates(self, refreshable):
+        """If the refresh itself fails, that error reaches the caller and nothing is retried."""
+        session = MagicMock()
+        session.get.return_value = make_response(400, {"error": {"message": "Invalid client secret"}})
+        post, tokens = self.workflow()
+        
+        with patch.object(auth, "get_session", return_value=session):
+            with pytest.raises(click.ClickException, match="Failed to refresh token"):
+                post()
+        
+        assert tokens == ["old"]
+        assert refreshable.load()["access_token"] == "old"
+    
+    @pytest.mark.parametrize("status, body", [
+        (401, {"error": {"message": "bad token"}}),
+        (400, {"error": {"code": 190}}),
+        (401, ["not", "a", "dict"]),
+    ])
+    def test_token_errors_detected(self, status, body):
+        """401s and code 190 count as token rejections, whatever the body shape."""
+        with pytest.raises(auth.TokenRejectedError):
+            auth.check_token_error(make_response(status, body))
+    
+    @pytest.mark.parametrize("status, body", [
+        (200, {"id": "1"}),
+        (400, {"error": {"code": 100}}),
+        (400, {"error": "not a dict"}),
+        (500, "plain string"),
+    ])
+    def test_other_errors_ignored(self, status, body):
+        """Other failures are left to the caller's own status handling."""
+        auth.check_token_error(make_response(status, body))
+
+
+class TestStreamingMultipart:
+    """Tests for the streamed multipart upload body."""
+    
+    @pytest.mark.parametrize("filename, content_type", [
+        ("clip.mp4", "video/mp4"),
+        ("clip.mov", "video/quicktime"),
+        ("clip.unknownext", "application/octet-stream"),
+    ])
+    def test_matches_requests_encoding(self, tmp_path, monkeypatch, filename, content_type):
+        """Bytes, length and content type match what requests builds for files=."""
+        video = tmp_path / filename
+        video.write_bytes(bytes(range(256)) * 4096)
+        fields = {"access_token": "token", "description": "Café ✓"}
+        monkeypatch.setattr(StreamingMultipart, "CHUNK_SIZE", 1000)
+        
+        body = StreamingMultipart(fields, "source", str(video))
+        monkeypatch.setattr("urllib3.filepost.choose_boundary", lambda: body.boundary)
+        with open(video, "rb") as f:
+            expected, expected_type = requests.models.RequestEncodingMixin._encode_files(
+                {"source": (filename, f, content_type)}, fields
+            )
+        
+        assert b"".join(body) == expected
+        assert len(body) == len(expected)
+        assert body.content_type == expected_type
+        assert f"Content-Type: {content_type}\r\n".encode() in expected
+    
+    def test_iterates_again_identically(self, tmp_path):
+        """A retried request re-reads the file and sends the same bytes."""
+        video = tmp_path / "clip.mp4"
+        video.write_bytes(b"frame" * 300000)
+        body = StreamingMultipart({"access_token": "token"}, "source", str(video))
+        
+        first = b"".join(body)
+        assert b"".join(body) == first
+        assert len(first) == len(body)
@@ -0,0 +1,57 @@
+"""Tests for the fast (LaTeX-free) slide renderer in from_idea."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from vbsocial.generate import from_idea
+from vbsocial.generate.from_idea import needs_latex
+
+
+def make_plan(*slides: tuple[str, str]) -> SimpleNamespace:
+    """Build a minimal content plan from (title, content) pairs."""
+    return SimpleNamespace(slides=[SimpleNamespace(title=t, content=c) for t, c in slides])
+
+
+class TestNeedsLatex:
+    """Tests for choosing between the fast renderer and pdflatex."""
+    
+    def test_plain_text_is_fast(self):
+        """Plain Latin-1 text (accents included) can be drawn directly."""
+        plan = make_plan(("Newton's First Law", "A body at rest stays at rest."), ("Café", "Naïve 50% & more"))
+        assert needs_latex(plan) is False
+    
+    def test_math_needs_latex(self):
+        """Inline math falls back to pdflatex."""
+        assert needs_latex(make_plan(("Energy", "$E = mc^2$")))
+    
+    def test_commands_need_latex(self):
+        """LaTeX commands fall back to pdflatex."""
+        assert needs_latex(make_plan((r"\textbf{Force}", "F = ma")))
+    
+    @pytest.mark.parametrize("text", ["angle θ", "ω = 2πf", "a → b", "— dash", "गति"])
+    def test_non_latin1_needs_latex(self, text):
+        """Characters the base-14 fonts lack fall back to pdflatex."""
+        assert needs_latex(make_plan(("Title", "ok"), ("Title", text)))
+        assert needs_latex(make_plan((text, "ok")))
+
+
+class TestFastLayout:
+    """Tests for the fast renderer's layout helpers."""
+    
+    def test_block_centered(self):
+        """Title, gap and body are centered as one block."""
+        top = from_idea._block_top(20, 100)
+        bottom = top + 20 + from_idea._TITLE_GAP + 100
+        assert top == pytest.approx(from_idea._PAGE_SIZE - bottom)
+    
+    def test_block_too_tall_starts_at_top(self):
+        """Overflowing content starts at the top edge instead of above it."""
+        assert from_idea._block_top(50, 1000) == 0
+    
+    def test_text_height_grows_with_wrapping(self):
+        """Longer text wraps onto more lines at the slide width."""
+        fitz = pytest.importorskip("fitz")
+        one_line = from_idea._text_height(fitz, "short", from_idea._BODY_SIZE, "helv")
+        wrapped = from_idea._text_height(fitz, "word " * 200, from_idea._BODY_SIZE, "helv")
+        assert 0 < one_line < wrapped
@@ -12,3 +12,7 @@ def __getattr__(name):
         from .content_planner import plan_content, ContentPlan
         return plan_content if name == "plan_content" else ContentPlan
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
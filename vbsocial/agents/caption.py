@@ -7,10 +7,17 @@ Two-part caption system:
 Combined must fit within platform limits.
 """
 
+import functools
+import re
+from collections.abc import Iterable
+from itertools import islice
+from pathlib import Path
+
 from pydantic import BaseModel, Field
 
 from .config import get_agent_config
 from .debug import log_agent_call, log_agent_result
+from .workers import with_event_loop
 
 
 # Character limits per platform
@@ -22,6 +29,18 @@ CHAR_LIMITS = {
     "youtube": 5000,
 }
 
+# (platform, char limit, physics/code separator); None means physics only
+_COMBINE_TABLE = (
+    ("instagram", CHAR_LIMITS["instagram"], "\n\n"),
+    ("facebook", CHAR_LIMITS["facebook"], "\n\n---\n\n"),
+    ("linkedin", CHAR_LIMITS["linkedin"], "\n\n---\n\n"),
+    ("x", CHAR_LIMITS["x"], None),
+    ("youtube", CHAR_LIMITS["youtube"], "\n\n---\n\n"),
+)
+
+# Lines that declare a type or function in any of the datamodel languages
+_STRUCT_RE = re.compile(r"\b(?:struct|class|fn|func|def|impl)\s")
+
 
 class CaptionOutput(BaseModel):
     """Structured output for platform-specific captions."""
@@ -136,14 +155,21 @@ From physics to code: The problem naturally maps to a layered data model. Each m
 """
 
 
+@functools.lru_cache(maxsize=16)
+def _settings_for(effort: str):
+    """Build ModelSettings for a reasoning effort, reused across agent runs."""
+    from agents.model_settings import ModelSettings, Reasoning
+    
+    return ModelSettings(reasoning=Reasoning(effort=effort))
+
+
 def _run_caption_agent(prompt: str, input_text: str, output_type, name: str, model: str | None = None):
     """Run a caption agent with given prompt."""
     import time
     from vbagent.agents.base import create_agent, run_agent_sync
-    from agents.model_settings import ModelSettings, Reasoning
     
     config = get_agent_config("caption")
-    settings = ModelSettings(reasoning=Reasoning(effort=config["reasoning"]))
+    settings = _settings_for(config["reasoning"])
     
     agent = create_agent(
         name=name,
@@ -159,7 +185,7 @@ def _run_caption_agent(prompt: str, input_text: str, output_type, name: str, mod
     result = run_agent_sync(agent, input_text)
     duration_ms = (time.time() - start) * 1000
     
-    log_agent_result(name, str(result), duration_ms)
+    log_agent_result(name, result, duration_ms)
     
     return result
 
@@ -181,15 +207,30 @@ def generate_physics_captions(problem: str, solution: str = "", idea: str = "",
     )
 
 
-def generate_code_captions(code_snippets: dict[str, str], model: str | None = None) -> CodeCaptionOutput:
-    """Generate code-focused caption additions (part 2)."""
+def _first_k_structs(lines: Iterable[str], k: int = 5) -> list[str]:
+    """Return the first k declaration lines, stopping once found."""
+    return list(islice((l.strip() for l in lines if _STRUCT_RE.search(l)), k))
+
+
+def _scan_structs(path: Path) -> list[str] | None:
+    """Stream a code file until its first declarations are found.
+    
+    Returns None if the file does not exist.
+    """
+    try:
+        with path.open() as f:
+            return _first_k_structs(f)
+    except FileNotFoundError:
+        return None
+
+
+def _generate_code_captions(structs: dict[str, list[str]], model: str | None = None) -> CodeCaptionOutput:
+    """Run the code caption agent on per-language declaration lines."""
     input_parts = ["## Code Implementations Available", ""]
-    for lang, code in code_snippets.items():
+    for lang, lang_structs in structs.items():
         # Include structure info, not full code
-        lines = code.split('\n')
-        structs = [l.strip() for l in lines if any(kw in l for kw in ['struct ', 'class ', 'fn ', 'func ', 'def ', 'impl '])]
         input_parts.append(f"### {lang.title()}")
-        input_parts.append(f"Key elements: {', '.join(structs[:5])}")
+        input_parts.append(f"Key elements: {', '.join(lang_structs)}")
         input_parts.append("")
     
     return _run_caption_agent(
@@ -201,75 +242,102 @@ def generate_code_captions(code_snippets: dict[str, str], model: str | None = No
     )
 
 
+def generate_code_captions(code_snippets: dict[str, str], model: str | None = None) -> CodeCaptionOutput:
+    """Generate code-focused caption additions (part 2)."""
+    structs = {lang: _first_k_structs(code.splitlines()) for lang, code in code_snippets.items()}
+    return _generate_code_captions(structs, model)
+
+
+def generate_code_captions_from_paths(code_paths: dict[str, Path], model: str | None = None) -> CodeCaptionOutput:
+    """Generate code caption additions from code files (part 2).
+    
+    Only the first few declaration lines of each file are read; missing
+    files are skipped.
+    """
+    structs = {}
+    for lang, path in code_paths.items():
+        lang_structs = _scan_structs(path)
+        if lang_structs is not None:
+            structs[lang] = lang_structs
+    return _generate_code_captions(structs, model)
+
+
 def combine_captions(physics: CaptionOutput, code: CodeCaptionOutput) -> dict[str, str]:
     """Combine physics and code captions, respecting platform limits."""
     combined = {}
     
-    for platform in ["instagram", "facebook", "linkedin", "x", "youtube"]:
+    for platform, limit, separator in _COMBINE_TABLE:
         physics_text = getattr(physics, platform)
-        code_text = getattr(code, platform)
-        limit = CHAR_LIMITS[platform]
         
         # Combine with separator
-        if platform == "x":
+        if separator is None:
             # X is too short - just use physics or truncate
             full = physics_text
         else:
-            separator = "\n\n---\n\n" if platform in ("facebook", "linkedin", "youtube") else "\n\n"
-            full = physics_text + separator + code_text
+            full = "".join((physics_text, separator, getattr(code, platform)))
         
         # Truncate if needed
         if len(full) > limit:
-            full = full[:limit-3] + "..."
+            full = f"{full[:limit-3]}..."
         
         combined[platform] = full
     
     return combined
 
 
+def _try_read(path: Path) -> str:
+    """Read a text file, returning "" if it does not exist."""
+    try:
+        return path.read_text()
+    except FileNotFoundError:
+        return ""
+
+
 def generate_captions_from_post(post_path: str) -> dict[str, str]:
     """Generate combined captions from an existing post directory.
     
     Returns dict with platform -> caption for use in post.yaml
     """
-    from pathlib import Path
+    from concurrent.futures import ThreadPoolExecutor
     
     post_dir = Path(post_path)
     
-    # Read physics components
-    problem = ""
-    solution = ""
-    idea = ""
-    
-    if (post_dir / "problem.tex").exists():
-        problem = (post_dir / "problem.tex").read_text()
-    if (post_dir / "solution.tex").exists():
-        solution = (post_dir / "solution.tex").read_text()
-    if (post_dir / "idea.tex").exists():
-        idea = (post_dir / "idea.tex").read_text()
-    
-    # Read code files
-    code_snippets = {}
+    tex_files = ["problem.tex", "solution.tex", "idea.tex"]
     code_files = [
         ("rust", "datamodel.rs"),
         ("swift", "datamodel.swift"),
         ("python", "datamodel.py"),
         ("c", "datamodel.c"),
     ]
-    for lang, filename in code_files:
-        filepath = post_dir / filename
-        if filepath.exists():
-            code_snippets[lang] = filepath.read_text()
+    tex_paths = [post_dir / name for name in tex_files]
+    code_paths = [post_dir / filename for _, filename in code_files]
     
-    # Generate physics captions
-    physics_captions = generate_physics_captions(problem, solution, idea)
+    # Read all candidate files concurrently so their I/O latency overlaps;
+    # code files are only scanned up to their first few declarations
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        texts = pool.map(_try_read, tex_paths)
+        scans = pool.map(_scan_structs, code_paths)
+        
+        # Read physics components
+        problem, solution, idea = texts
+        
+        # Read code files
+        code_structs = {
+            lang: lang_structs
+            for (lang, _), lang_structs in zip(code_files, scans)
+            if lang_structs is not None
+        }
     
-    # Generate code captions if code exists
-    if code_snippets:
-        code_captions = generate_code_captions(code_snippets)
-        return combine_captions(physics_captions, code_captions)
+    # Generate code captions if code exists; the two agent calls are
+    # independent round-trips, so run them concurrently
+    if code_structs:
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            physics_future = pool.submit(with_event_loop(generate_physics_captions), problem, solution, idea)
+            code_future = pool.submit(with_event_loop(_generate_code_captions), code_structs)
+            return combine_captions(physics_future.result(), code_future.result())
     else:
         # No code - just return physics captions as dict
+        physics_captions = generate_physics_captions(problem, solution, idea)
         return {
             "instagram": physics_captions.instagram,
             "facebook": physics_captions.facebook,
@@ -17,10 +17,13 @@ agents:
 ```
 """
 
+import copy
+import functools
+import os
 from pathlib import Path
 from typing import Any
 
-import yaml
+from ..common.yaml_utils import yaml_classes
 
 
 CONFIG_DIR = Path.home() / ".config" / "vbsocial"
@@ -42,25 +45,61 @@ DEFAULTS = {
     },
 }
 
+# Cached (exists, mtime) of CONFIG_FILE; reset by save_config
+_config_stat_cache: tuple[bool, float] | None = None
 
-def load_config() -> dict[str, Any]:
-    """Load config from file, creating defaults if not exists."""
-    if not CONFIG_FILE.exists():
-        return {"agents": DEFAULTS.copy()}
+
+@functools.lru_cache(maxsize=1)
+def _load_config_cached(stat: tuple[bool, float]) -> dict[str, Any]:
+    """Parse the config file; cached per (exists, mtime). Never mutate the result."""
+    exists, _ = stat
+    if not exists:
+        return {"agents": copy.deepcopy(DEFAULTS)}
     
     try:
-        with open(CONFIG_FILE) as f:
-            config = yaml.safe_load(f) or {}
-        return config
+        import yaml
+        
+        loader, _ = yaml_classes()
+        return yaml.load(CONFIG_FILE.read_bytes(), Loader=loader) or {}
     except Exception:
-        return {"agents": DEFAULTS.copy()}
+        return {"agents": copy.deepcopy(DEFAULTS)}
+
+
+def _get_stat() -> tuple[bool, float]:
+    """Return (exists, mtime) for the config file, probed once per process."""
+    global _config_stat_cache
+    if _config_stat_cache is None:
+        try:
+            _config_stat_cache = (True, CONFIG_FILE.stat().st_mtime)
+        except FileNotFoundError:
+            _config_stat_cache = (False, 0.0)
+    return _config_stat_cache
+
+
+def load_config() -> dict[str, Any]:
+    """Load config from file, creating defaults if not exists.
+    
+    Returns a private copy: callers may modify it before save_config without
+    affecting the cached parse.
+    """
+    return copy.deepcopy(_load_config_cached(_get_stat()))
 
 
 def save_config(config: dict[str, Any]) -> None:
     """Save config to file."""
+    import yaml
+    
+    _, dumper = yaml_classes()
+    payload = yaml.dump(config, Dumper=dumper, default_flow_style=False).encode()
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    with open(CONFIG_FILE, "w") as f:
-        yaml.dump(config, f, default_flow_style=False)
+    # Write to a temp file and rename so readers never see a partial config
+    tmp = CONFIG_FILE.with_suffix(".yaml.tmp")
+    tmp.write_bytes(payload)
+    os.replace(tmp, CONFIG_FILE)
+    
+    global _config_stat_cache
+    _config_stat_cache = None
+    _load_config_cached.cache_clear()
 
 
 def get_agent_config(agent_type: str) -> dict[str, str]:
@@ -72,8 +111,8 @@ def get_agent_config(agent_type: str) -> dict[str, str]:
     Returns:
         Dict with 'model' and 'reasoning' keys
     """
-    config = load_config()
-    agents = config.get("agents", {})
+    # Read-only use of the cached parse, so no copy is needed
+    agents = _load_config_cached(_get_stat()).get("agents", {})
     
     # Merge defaults with user config
     defaults = DEFAULTS.get(agent_type, {"model": "gpt-5-mini", "reasoning": "medium"})
@@ -110,6 +149,6 @@ def set_agent_config(agent_type: str, model: str | None = None, reasoning: str |
 
 def init_default_config() -> Path:
     """Initialize config file with defaults if not exists."""
-    if not CONFIG_FILE.exists():
-        save_config({"agents": DEFAULTS.copy()})
+    if not _get_stat()[0]:
+        save_config({"agents": copy.deepcopy(DEFAULTS)})
     return CONFIG_FILE
@@ -2,8 +2,6 @@
 
 from pydantic import BaseModel, Field
 
-from vbagent.agents.base import create_agent, run_agent_sync
-
 from .config import get_agent_config
 
 
@@ -69,6 +67,8 @@ def plan_content(
     Returns:
         ContentPlan with structured slide content
     """
+    from vbagent.agents.base import create_agent, run_agent_sync
+    
     config = get_agent_config("content_planner")
     
     agent = create_agent(
@@ -2,10 +2,19 @@
 
 Generates code representations of physics problems in various languages.
 Teaches students how to model physics concepts in programming.
+
+Performance: wall time here is dominated by the network round-trip to the
+model endpoint; the local work is a little string templating. Speedups come
+from prompt-prefix reuse (static prompt text first) and concurrent fan-out
+(generate_datamodels_batch), not from JIT/C-extension work on this module.
 """
 
+import functools
+
+from ..common.markdown import strip_code_fence
 from .config import get_agent_config
 from .debug import debug_agent, debug_transform, log_agent_call, log_agent_result
+from .workers import with_event_loop
 
 
 # ============================================================================
@@ -31,61 +40,44 @@ BASE_RULES = """## Rules
 - NO explanations
 """
 
-RUST_PROMPT = f"""You are a Rust architect. Generate a concise data model for physics problems.
+# Static body of every language prompt, after the one-line persona and before
+# the language-specific *_RULES tail (see get_language_prompt). Each language's
+# prompt is identical on every call, so provider-side prefix caching reuses it.
+BASE_PROMPT = f"""Generate a concise data model for physics problems.
 
-{BASE_RULES}
+{BASE_RULES}"""
 
-## Rust Specific
+RUST_RULES = """## Rust Specific
 - ONLY struct, impl, enum, trait
 - Use f64 for quantities
 - Use (f64, f64) or [f64; 2] for vectors
 """
 
-PYTHON_PROMPT = f"""You are a Python developer. Generate a concise data model for physics problems.
-
-{BASE_RULES}
-
-## Python Specific
+PYTHON_RULES = """## Python Specific
 - ONLY dataclass definitions with methods
 - Use float for quantities
 - Use tuple[float, float] for vectors
 """
 
-SWIFT_PROMPT = f"""You are a Swift developer. Generate a concise data model for physics problems.
-
-{BASE_RULES}
-
-## Swift Specific
+SWIFT_RULES = """## Swift Specific
 - ONLY struct, extension, enum, protocol
 - Use Double for quantities
 """
 
-C_PROMPT = f"""You are a C developer. Generate a concise data model for physics problems.
-
-{BASE_RULES}
-
-## C Specific
+C_RULES = """## C Specific
 - ONLY struct, typedef, function definitions
 - Use double for quantities
 - Use struct for vectors
 - Include function implementations (not just declarations)
 """
 
-ZIG_PROMPT = f"""You are a Zig developer. Generate a concise data model for physics problems.
-
-{BASE_RULES}
-
-## Zig Specific
+ZIG_RULES = """## Zig Specific
 - ONLY struct, const, fn
 - Use f64 for quantities
 - Use [2]f64 for vectors
 """
 
-GO_PROMPT = f"""You are a Go developer. Generate a concise data model for physics problems.
-
-{BASE_RULES}
-
-## Go Specific
+GO_RULES = """## Go Specific
 - ONLY struct, type, func
 - Use float64 for quantities
 - Use [2]float64 for vectors
@@ -96,18 +88,26 @@ GO_PROMPT = f"""You are a Go developer. Generate a concise data model for physic
 # USER TEMPLATES
 # ============================================================================
 
-USER_TEMPLATE = """Generate a minimal {language} data model for this physics problem:
+# Static instructions come first and per-call values last, with the target
+# language at the very end, so messages for the same problem share their
+# longest possible prefix across languages.
+USER_STATIC_PREFIX = """Generate a minimal data model for the physics problem below, in the target language given at the end.
+Keep it brief - only essential types and methods.
+"""
 
+USER_TEMPLATE = USER_STATIC_PREFIX + """
 ## Problem
 {problem}
 
 ## Solution Context
 {solution}
 
-Keep it brief - only essential types and methods.
+## Target Language
+{language}
 """
 
-USER_TEMPLATE_WITH_REFERENCE = """Generate a minimal {language} data model for this physics problem.
+USER_TEMPLATE_WITH_REFERENCE = USER_STATIC_PREFIX + """Use the SAME variable names, function names, and structure as the reference code.
+Keep naming consistent with the reference.
 
 ## Problem
 {problem}
@@ -116,13 +116,12 @@ USER_TEMPLATE_WITH_REFERENCE = """Generate a minimal {language} data model for t
 {solution}
 
 ## Reference Code ({ref_language})
-Use the SAME variable names, function names, and structure as this reference:
-
 ```{ref_language}
 {reference_code}
 ```
 
-Keep naming consistent with the reference.
+## Target Language
+{language}
 """
 
 
@@ -131,12 +130,12 @@ Keep naming consistent with the reference.
 # ============================================================================
 
 LANGUAGE_CONFIG = {
-    "rust": {"prompt": RUST_PROMPT, "ext": "rs", "block": "rust"},
-    "python": {"prompt": PYTHON_PROMPT, "ext": "py", "block": "python"},
-    "swift": {"prompt": SWIFT_PROMPT, "ext": "swift", "block": "swift"},
-    "c": {"prompt": C_PROMPT, "ext": "c", "block": "c"},
-    "zig": {"prompt": ZIG_PROMPT, "ext": "zig", "block": "zig"},
-    "go": {"prompt": GO_PROMPT, "ext": "go", "block": "go"},
+    "rust": {"persona": "You are a Rust architect.", "rules": RUST_RULES, "ext": "rs", "block": "rust"},
+    "python": {"persona": "You are a Python developer.", "rules": PYTHON_RULES, "ext": "py", "block": "python"},
+    "swift": {"persona": "You are a Swift developer.", "rules": SWIFT_RULES, "ext": "swift", "block": "swift"},
+    "c": {"persona": "You are a C developer.", "rules": C_RULES, "ext": "c", "block": "c"},
+    "zig": {"persona": "You are a Zig developer.", "rules": ZIG_RULES, "ext": "zig", "block": "zig"},
+    "go": {"persona": "You are a Go developer.", "rules": GO_RULES, "ext": "go", "block": "go"},
 }
 
 
@@ -144,17 +143,18 @@ LANGUAGE_CONFIG = {
 # AGENT FUNCTIONS
 # ============================================================================
 
+@functools.lru_cache(maxsize=None)
+def get_language_prompt(language: str) -> str:
+    """Build the system prompt for a language on first use."""
+    lang_config = LANGUAGE_CONFIG[language]
+    return f"{lang_config['persona']} {BASE_PROMPT}\n\n{lang_config['rules']}"
+
+
 @debug_transform
 def clean_code_output(result: str, language: str) -> str:
     """Clean up markdown code blocks from output."""
     block = LANGUAGE_CONFIG.get(language, {}).get("block", language)
-    
-    if f"```{block}" in result:
-        result = result.split(f"```{block}")[1].split("```")[0]
-    elif "```" in result:
-        result = result.split("```")[1].split("```")[0]
-    
-    return result.strip()
+    return strip_code_fence(result, (block,))
 
 
 def generate_datamodel(
@@ -181,6 +181,7 @@ def generate_datamodel(
     import time
     from vbagent.agents.base import create_agent, run_agent_sync
     from agents.model_settings import ModelSettings, Reasoning
+    from ..common.llm_cache import cached_run
     
     if language not in LANGUAGE_CONFIG:
         raise ValueError(f"Unsupported language: {language}. Use: {list(LANGUAGE_CONFIG.keys())}")
@@ -192,7 +193,7 @@ def generate_datamodel(
     
     agent = create_agent(
         name=f"{language.title()}DataModelAgent",
-        instructions=lang_config["prompt"],
+        instructions=get_language_prompt(language),
         model=model or config["model"],
         model_settings=settings,
     )
@@ -223,7 +224,13 @@ def generate_datamodel(
     )
     
     start = time.time()
-    result = run_agent_sync(agent, input_text)
+    result = cached_run(
+        f"{language.title()}DataModelAgent:{config['reasoning']}",
+        input_text,
+        model or config["model"],
+        lambda: run_agent_sync(agent, input_text),
+        prompt=get_language_prompt(language),
+    )
     duration_ms = (time.time() - start) * 1000
     
     # Log raw result
@@ -232,6 +239,40 @@ def generate_datamodel(
     return clean_code_output(result, language)
 
 
+def generate_datamodels_batch(
+    problem: str,
+    languages: list[str],
+    solution: str = "",
+    model: str | None = None,
+) -> dict[str, str]:
+    """Generate data models for several languages concurrently.
+    
+    Each language is an independent agent call, so they run in parallel and
+    the batch takes roughly as long as the slowest one.
+    
+    Args:
+        problem: The physics problem (LaTeX)
+        languages: Target languages (rust, python, swift, c, zig, go)
+        solution: Solution context (LaTeX)
+        model: Override model from config
+        
+    Returns:
+        Dict of language -> generated code, in the order given
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    
+    for language in languages:
+        if language not in LANGUAGE_CONFIG:
+            raise ValueError(f"Unsupported language: {language}. Use: {list(LANGUAGE_CONFIG.keys())}")
+    
+    with ThreadPoolExecutor(max_workers=max(1, len(languages))) as pool:
+        futures = {
+            language: pool.submit(with_event_loop(generate_datamodel), problem, language, solution, model=model)
+            for language in languages
+        }
+        return {language: future.result() for language, future in futures.items()}
+
+
 def get_code_file_extension(language: str) -> str:
     """Get file extension for a language."""
     return LANGUAGE_CONFIG.get(language, {}).get("ext", language)
@@ -12,10 +12,9 @@ import json
 import os
 import sys
 from datetime import datetime
+from itertools import islice
 from typing import Any, Callable
 
-import yaml
-
 
 # Check if debug mode is enabled
 def is_debug_enabled() -> bool:
@@ -31,22 +30,20 @@ def is_debug_enabled() -> bool:
         return False
 
 
-# Global debug state
-_DEBUG = None
-
-
+@functools.cache
 def debug_enabled() -> bool:
     """Cached check for debug mode."""
-    global _DEBUG
-    if _DEBUG is None:
-        _DEBUG = is_debug_enabled()
-    return _DEBUG
+    return is_debug_enabled()
 
 
 def reset_debug_cache() -> None:
     """Reset debug cache (for testing)."""
-    global _DEBUG
-    _DEBUG = None
+    debug_enabled.cache_clear()
+
+
+# Static parts of each debug event block
+_HEADER = "\n" + "=" * 60 + "\n[DEBUG] "
+_RULE = "\n" + "-" * 60 + "\n"
 
 
 def log_debug(event_type: str, data: dict[str, Any]) -> None:
@@ -59,34 +56,52 @@ def log_debug(event_type: str, data: dict[str, Any]) -> None:
     if not debug_enabled():
         return
     
+    import yaml
+    from ..common.yaml_utils import yaml_classes
+    
+    _, dumper = yaml_classes()
     event = {
         "timestamp": datetime.now().isoformat(),
         "event": event_type,
         **data,
     }
     
-    # Print separator and YAML
-    print("\n" + "=" * 60, file=sys.stderr)
-    print(f"[DEBUG] {event_type.upper()}", file=sys.stderr)
-    print("-" * 60, file=sys.stderr)
-    print(yaml.dump(event, default_flow_style=False, allow_unicode=True, width=120), file=sys.stderr)
+    # Separator, header and YAML in a single write
+    yaml_text = yaml.dump(event, Dumper=dumper, default_flow_style=False, allow_unicode=True, width=120)
+    sys.stderr.write(f"{_HEADER}{event_type.upper()}{_RULE}{yaml_text}\n")
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Cut text to limit chars, marking a cut with '...'."""
+    head = text[:limit + 1]
+    return head[:limit] + "..." if len(head) > limit else head
 
 
 def log_agent_call(agent_name: str, input_text: str, **kwargs: Any) -> None:
     """Log an agent call."""
+    if not debug_enabled():
+        return
+    
     log_debug("agent_call", {
         "agent": agent_name,
-        "input": input_text[:500] + "..." if len(input_text) > 500 else input_text,
+        "input": _truncate(input_text, 500),
         "input_length": len(input_text),
         "kwargs": {k: str(v)[:100] for k, v in kwargs.items()},
     })
 
 
-def log_agent_result(agent_name: str, result: str, duration_ms: float | None = None) -> None:
-    """Log an agent result."""
+def log_agent_result(agent_name: str, result: Any, duration_ms: float | None = None) -> None:
+    """Log an agent result.
+    
+    Non-string results are stringified only when debug mode is on.
+    """
+    if not debug_enabled():
+        return
+    
+    result = str(result)
     log_debug("agent_result", {
         "agent": agent_name,
-        "output": result[:1000] + "..." if len(result) > 1000 else result,
+        "output": _truncate(result, 1000),
         "output_length": len(result),
         "duration_ms": duration_ms,
     })
@@ -94,13 +109,16 @@ def log_agent_result(agent_name: str, result: str, duration_ms: float | None = N
 
 def log_transform(func_name: str, input_data: Any, output_data: Any, **kwargs: Any) -> None:
     """Log a data transformation."""
+    if not debug_enabled():
+        return
+    
     def truncate(data: Any, max_len: int = 500) -> Any:
         if isinstance(data, str):
-            return data[:max_len] + "..." if len(data) > max_len else data
+            return _truncate(data, max_len)
         elif isinstance(data, list):
-            return [truncate(item, max_len // 2) for item in data[:5]]
+            return [truncate(item, max_len // 2) for item in islice(data, 5)]
         elif isinstance(data, dict):
-            return {k: truncate(v, max_len // 2) for k, v in list(data.items())[:5]}
+            return {k: truncate(v, max_len // 2) for k, v in islice(data.items(), 5)}
         return str(data)[:max_len]
     
     log_debug("transform", {
@@ -112,10 +130,16 @@ def log_transform(func_name: str, input_data: Any, output_data: Any, **kwargs: A
 
 
 def debug_agent(func: Callable) -> Callable:
-    """Decorator to log agent function calls and results."""
+    """Decorator to log agent function calls and results.
+    
+    Debug mode can be switched on at runtime (e.g. `add -d`), so the check
+    happens per call; it is bound into the closure to keep the off path cheap.
+    """
+    enabled = debug_enabled
+    
     @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        if not debug_enabled():
+        if not enabled():
             return func(*args, **kwargs)
         
         import time
@@ -144,9 +168,11 @@ def debug_agent(func: Callable) -> Callable:
 
 def debug_transform(func: Callable) -> Callable:
     """Decorator to log transformation functions."""
+    enabled = debug_enabled
+    
     @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        if not debug_enabled():
+        if not enabled():
             return func(*args, **kwargs)
         
         result = func(*args, **kwargs)
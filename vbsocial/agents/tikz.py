@@ -7,6 +7,7 @@ Uses vbagent's tikz agent to:
 
 from pathlib import Path
 
+from ..common.markdown import strip_code_fence
 from .config import get_agent_config
 from .debug import log_agent_call, log_agent_result, debug_transform
 
@@ -90,6 +91,7 @@ def generate_tikz_illustration(problem: str, solution: str = "") -> str:
     import time
     from vbagent.agents.base import create_agent, run_agent_sync
     from agents.model_settings import ModelSettings, Reasoning
+    from ..common.llm_cache import cached_run
     
     config = get_agent_config("datamodel")  # Use same config as datamodel
     
@@ -110,20 +112,19 @@ def generate_tikz_illustration(problem: str, solution: str = "") -> str:
     log_agent_call("TikZIllustrator", input_text, model=config["model"])
     
     start = time.time()
-    result = run_agent_sync(agent, input_text)
+    result = cached_run(
+        f"TikZIllustrator:{config['reasoning']}",
+        input_text,
+        config["model"],
+        lambda: run_agent_sync(agent, input_text),
+        prompt=ILLUSTRATE_PROMPT,
+    )
     duration_ms = (time.time() - start) * 1000
     
     log_agent_result("TikZIllustrator", result, duration_ms)
     
     # Clean up markdown if present
-    if "```tikz" in result:
-        result = result.split("```tikz")[1].split("```")[0]
-    elif "```latex" in result:
-        result = result.split("```latex")[1].split("```")[0]
-    elif "```" in result:
-        result = result.split("```")[1].split("```")[0]
-    
-    return result.strip()
+    return strip_code_fence(result, ("tikz", "latex"))
 
 
 def generate_tikz(
@@ -0,0 +1,29 @@
+"""Running agent calls on worker threads."""
+
+import functools
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+
+def with_event_loop(fn: Callable[..., T]) -> Callable[..., T]:
+    """Wrap fn to run with a fresh event loop set for the current thread.
+    
+    vbagent's run_agent_sync may look up the thread's loop with
+    asyncio.get_event_loop(), which raises outside the main thread, so jobs
+    submitted to a ThreadPoolExecutor get their own loop for the call.
+    Only use it for worker threads; it leaves no loop set afterwards.
+    """
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs) -> T:
+        import asyncio
+        
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+    
+    return wrapper
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import time
 from pathlib import Path
 from typing import Any
 
@@ -38,9 +38,8 @@ class TokenManager:
         if "expires_at" not in token:
             return False
         
-        expiry = datetime.fromtimestamp(token["expires_at"])
-        from datetime import timedelta
-        return datetime.now() > expiry - timedelta(minutes=buffer_minutes)
+        # Plain epoch arithmetic; no datetime objects needed
+        return time.time() > token["expires_at"] - buffer_minutes * 60
     
     def get_valid_token(self) -> dict[str, Any] | None:
         """Get token if it exists and is not expired."""
@@ -6,6 +6,11 @@ import stat
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib encoder
+    orjson = None
+
 # Base directory for all vbsocial config/tokens
 VBSOCIAL_DIR = Path.home() / ".vbsocial"
 
@@ -18,24 +23,45 @@ def get_platform_dir(platform: str) -> Path:
 def ensure_dir(path: Path) -> None:
     """Create directory with secure permissions if it doesn't exist."""
     path.mkdir(parents=True, exist_ok=True)
-    # Set directory permissions to owner-only (700)
+    # Set directory permissions to owner-only (700), also tightening existing dirs
     os.chmod(path, stat.S_IRWXU)
 
 
+def _dumps(data: Any) -> bytes:
+    """Serialize data to indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        )
+    return (json.dumps(data, indent=2) + "\n").encode()
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 def save_json(path: Path, data: dict[str, Any]) -> None:
     """Save JSON data to file with secure permissions."""
     ensure_dir(path.parent)
-    with open(path, "w") as f:
-        json.dump(data, f, indent=4)
-    # Set file permissions to owner read/write only (600)
-    os.chmod(path, stat.S_IRUSR | stat.S_IWUSR)
+    # New files are created owner read/write only (600)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, stat.S_IRUSR | stat.S_IWUSR)
+    try:
+        # Existing files may predate that; tighten them via the open fd
+        os.fchmod(fd, stat.S_IRUSR | stat.S_IWUSR)
+        view = memoryview(_dumps(data))
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
 
 def load_json(path: Path) -> dict[str, Any] | None:
     """Load JSON data from file, returns None if not found."""
     try:
-        with open(path, "r") as f:
-            return json.load(f)
+        return _loads(path.read_bytes())
     except FileNotFoundError:
         return None
     except json.JSONDecodeError:
@@ -0,0 +1,65 @@
+"""Shared file I/O helpers."""
+
+import functools
+import os
+import time
+from pathlib import Path
+
+# Some filesystems store mtimes in whole seconds (FAT: 2 s), so a file changed
+# this recently could be rewritten again without its mtime moving
+_MTIME_GRANULARITY_NS = 2_000_000_000
+
+
+@functools.lru_cache(maxsize=64)
+def _read_text_for_mtime(path: str, mtime_ns: int, size: int) -> str:
+    """Read a file; mtime_ns and size only key the cache, so an unchanged file is read once."""
+    return Path(path).read_text()
+
+
+def mtime_is_trustworthy(st: os.stat_result) -> bool:
+    """Whether st_mtime_ns can key a cache of the file's contents.
+    
+    A file modified within the last mtime tick may be rewritten in the same
+    tick, leaving its mtime unchanged, so it should be read fresh instead.
+    """
+    return time.time_ns() - st.st_mtime_ns >= _MTIME_GRANULARITY_NS
+
+
+def read_text_cached(path: Path) -> str:
+    """Read a text file, reusing the last read while its mtime and size are unchanged.
+
+    A file modified within the last mtime tick is read fresh. Returns "" if
+    the file doesn't exist.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return ""
+    if not mtime_is_trustworthy(st):
+        return path.read_text()
+    return _read_text_for_mtime(str(path), st.st_mtime_ns, st.st_size)
+
+
+def read_text_fd(path: Path) -> str:
+    """Read a whole UTF-8 file with raw os.read calls sized from fstat (uncached)."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = [os.read(fd, max(os.fstat(fd).st_size, 1))]
+        # Only loops if the file grew or the read came back short
+        while chunk := os.read(fd, 1 << 16):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks).decode("utf-8")
+
+
+def write_text_fd(path: Path, content: str) -> None:
+    """Write text as UTF-8 bytes with a raw os.write loop, truncating any existing file."""
+    # 0o666 like open(); the umask applies as usual
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(content.encode("utf-8"))
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
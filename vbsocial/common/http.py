@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import atexit
+import random
 import time
 from typing import Any, Callable
 from functools import wraps
@@ -11,6 +13,11 @@ import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to requests' stdlib parser
+    orjson = None
+
 
 # Default timeout for all requests (connect, read)
 DEFAULT_TIMEOUT = (10, 60)
@@ -21,22 +28,25 @@ RETRY_BACKOFF = 0.5
 RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
 
 
-def create_session() -> requests.Session:
+# Retry objects are immutable (urllib3 derives a new one per attempt),
+# so one instance is shared by every adapter
+RETRY_STRATEGY = Retry(
+    total=MAX_RETRIES,
+    backoff_factor=RETRY_BACKOFF,
+    status_forcelist=RETRY_STATUS_CODES,
+    allowed_methods=["GET", "POST", "PUT", "DELETE"],
+    raise_on_status=False,
+)
+
+
+def create_session(pool_maxsize: int = 10) -> requests.Session:
     """Create a requests session with retry logic and connection pooling."""
     session = requests.Session()
     
-    retry_strategy = Retry(
-        total=MAX_RETRIES,
-        backoff_factor=RETRY_BACKOFF,
-        status_forcelist=RETRY_STATUS_CODES,
-        allowed_methods=["GET", "POST", "PUT", "DELETE"],
-        raise_on_status=False,
-    )
-    
     adapter = HTTPAdapter(
-        max_retries=retry_strategy,
-        pool_connections=10,
-        pool_maxsize=10,
+        max_retries=RETRY_STRATEGY,
+        pool_connections=pool_maxsize,
+        pool_maxsize=pool_maxsize,
     )
     
     session.mount("https://", adapter)
@@ -48,27 +58,54 @@ def create_session() -> requests.Session:
 # Global session for reuse
 _session: requests.Session | None = None
 
+# Pool size of the global session, sized for concurrent uploads/API calls
+SESSION_POOL_SIZE = 50
+
 
 def get_session() -> requests.Session:
-    """Get or create the global requests session."""
+    """Get or create the global requests session.
+    
+    The session keeps connections alive across calls and is closed at exit.
+    """
     global _session
     if _session is None:
-        _session = create_session()
+        _session = create_session(pool_maxsize=SESSION_POOL_SIZE)
+        atexit.register(_session.close)
     return _session
 
 
+def parse_json(response: requests.Response) -> Any:
+    """Parse a response body as JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def extract_error(response: requests.Response) -> str:
+    """Return the error message of a failed API response.
+    
+    Understands {"error": {"message": ...}} (Graph API) and {"message": ...}
+    bodies, falling back to the raw response text.
+    """
+    try:
+        data = parse_json(response)
+    except ValueError:
+        data = None
+    if isinstance(data, dict):
+        error = data.get("error")
+        message = (error.get("message") if isinstance(error, dict) else None) or data.get("message")
+        if message:
+            return message
+    return response.text or f"HTTP {response.status_code}"
+
+
 def handle_response(response: requests.Response, context: str = "API call") -> dict[str, Any]:
     """Handle API response with consistent error handling."""
     try:
         response.raise_for_status()
         return response.json() if response.content else {}
     except requests.exceptions.HTTPError:
-        try:
-            error_data = response.json()
-            error_msg = error_data.get("error", {}).get("message") or error_data.get("message") or str(error_data)
-        except (ValueError, KeyError):
-            error_msg = response.text or f"HTTP {response.status_code}"
-        raise click.ClickException(f"{context} failed: {error_msg}")
+        raise click.ClickException(f"{context} failed: {extract_error(response)}")
 
 
 def with_retry(
@@ -76,13 +113,19 @@ def with_retry(
     delay: float = 1.0,
     backoff: float = 2.0,
     exceptions: tuple = (requests.exceptions.RequestException,),
+    max_delay: float = 30.0,
+    jitter: float = 0.5,
 ) -> Callable:
-    """Decorator for retrying functions with exponential backoff."""
+    """Decorator for retrying functions with capped, jittered exponential backoff.
+    
+    The sleep before retry n (0-based) is min(max_delay, delay * backoff**n),
+    stretched by a random factor in [1, 1 + jitter] so concurrent clients
+    don't retry in lockstep.
+    """
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs):
             last_exception = None
-            current_delay = delay
             
             for attempt in range(max_attempts):
                 try:
@@ -90,8 +133,8 @@ def with_retry(
                 except exceptions as e:
                     last_exception = e
                     if attempt < max_attempts - 1:
-                        time.sleep(current_delay)
-                        current_delay *= backoff
+                        sleep = min(max_delay, delay * backoff ** attempt)
+                        time.sleep(sleep * (1 + random.uniform(0, jitter)))
             
             raise last_exception
         return wrapper
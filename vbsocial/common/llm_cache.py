@@ -0,0 +1,79 @@
+"""Content-addressed on-disk cache for LLM agent responses.
+
+Entries live in ~/.vbsocial/llm_cache/<key>.json, where the key hashes the
+agent, model, system prompt and input. Caching is opt-in because agents are
+non-deterministic and commands like `add --force` expect a fresh answer:
+
+    VBSOCIAL_LLM_CACHE_TTL=86400 vbsocial add -c rust   # reuse for 1 day
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import Callable
+
+from .config import VBSOCIAL_DIR, load_json, save_json
+
+CACHE_DIR = VBSOCIAL_DIR / "llm_cache"
+
+
+def default_ttl() -> int:
+    """Cache TTL in seconds from VBSOCIAL_LLM_CACHE_TTL (0 disables)."""
+    try:
+        return int(os.environ.get("VBSOCIAL_LLM_CACHE_TTL", "0"))
+    except ValueError:
+        return 0
+
+
+def cache_key(agent_key: str, model: str, input_text: str, prompt: str = "") -> str:
+    """Hash everything that determines an agent's response."""
+    payload = "\0".join((agent_key, model, prompt, input_text)).encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _cache_path(key: str) -> Path:
+    return CACHE_DIR / f"{key}.json"
+
+
+def cached_run(
+    agent_key: str,
+    input_text: str,
+    model: str,
+    runner: Callable[[], str],
+    prompt: str = "",
+    ttl: int | None = None,
+) -> str:
+    """Return a cached response for this agent call, or run it and cache it.
+
+    Args:
+        agent_key: Name of the agent (part of the cache key)
+        input_text: User input sent to the agent
+        model: Model name
+        runner: Zero-argument callable that performs the agent call
+        prompt: System prompt/instructions
+        ttl: Max entry age in seconds; defaults to VBSOCIAL_LLM_CACHE_TTL
+
+    Returns:
+        The agent output string
+    """
+    if ttl is None:
+        ttl = default_ttl()
+    if ttl <= 0:
+        return runner()
+
+    path = _cache_path(cache_key(agent_key, model, input_text, prompt))
+    try:
+        fresh = time.time() - path.stat().st_mtime < ttl
+    except FileNotFoundError:
+        fresh = False
+    if fresh:
+        entry = load_json(path)
+        if entry and isinstance(entry.get("output"), str):
+            return entry["output"]
+
+    result = runner()
+    save_json(path, {"agent": agent_key, "model": model, "output": result})
+    return result
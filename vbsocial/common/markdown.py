@@ -0,0 +1,22 @@
+"""Helpers for pulling code out of markdown-formatted LLM output."""
+
+import re
+
+# A fenced markdown code block: (language tag or None, body). The tag only counts
+# when a newline follows it, so one-line fences keep their first word; an
+# unclosed fence runs to the end.
+_FENCE_RE = re.compile(r"```(?:([\w+#-]+)[ \t]*\n|\n?)(.*?)(?:```|\Z)", re.DOTALL)
+
+
+def strip_code_fence(text: str, prefer: tuple[str, ...] = ()) -> str:
+    """Return the body of the first markdown code block in text, or text itself.
+    
+    A block tagged with one of the prefer languages wins over earlier blocks.
+    """
+    body = None
+    for match in _FENCE_RE.finditer(text):
+        if match.group(1) in prefer:
+            return match.group(2).strip()
+        if body is None:
+            body = match.group(2)
+    return (text if body is None else body).strip()
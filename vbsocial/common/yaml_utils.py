@@ -0,0 +1,17 @@
+"""On-demand PyYAML access shared by all commands."""
+
+import functools
+
+
+@functools.cache
+def yaml_classes() -> tuple[type, type]:
+    """Import PyYAML on demand, preferring the libyaml-backed loader/dumper.
+
+    Returns:
+        (SafeLoader, SafeDumper) classes, C-accelerated when available
+    """
+    try:
+        from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeLoader, SafeDumper
+    return SafeLoader, SafeDumper
@@ -0,0 +1,118 @@
+"""Graph API helpers shared by the Facebook commands."""
+
+import mimetypes
+import os
+import uuid
+from typing import Iterator
+
+import click
+import requests
+
+from .auth import get_cached_page_token, cache_page_token, check_token_error, GRAPH_BASE
+from ..common.http import DEFAULT_TIMEOUT, extract_error, parse_json
+
+
+def graph_url(path: str) -> str:
+    """Build a Graph API URL for the given path (e.g. "me/photos")."""
+    return f"{GRAPH_BASE}/{path.lstrip('/')}"
+
+
+class StreamingMultipart:
+    """multipart/form-data body that streams one file from disk.
+    
+    requests builds `files=` bodies fully in memory. This body knows its
+    length up front (so requests sends Content-Length, not chunked encoding)
+    and yields the file in large blocks; it can be iterated again if urllib3
+    retries the request.
+    """
+    
+    CHUNK_SIZE = 1 << 20
+    
+    def __init__(self, fields: dict[str, str], file_field: str, path: str, content_type: str | None = None):
+        self.path = path
+        # Guess from the file name (.mov, .webm, ...) when no type is given
+        if content_type is None:
+            content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        self.boundary = uuid.uuid4().hex
+        filename = os.path.basename(path).replace('"', "%22")
+        
+        head = "".join(
+            f'--{self.boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'
+            for name, value in fields.items()
+        )
+        head += (
+            f'--{self.boundary}\r\nContent-Disposition: form-data; name="{file_field}"; '
+            f'filename="{filename}"\r\nContent-Type: {content_type}\r\n\r\n'
+        )
+        self._head = head.encode()
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode()
+        self._length = len(self._head) + os.path.getsize(path) + len(self._tail)
+    
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+    
+    def __len__(self) -> int:
+        return self._length
+    
+    def __iter__(self) -> Iterator[bytes]:
+        yield self._head
+        with open(self.path, "rb") as f:
+            while chunk := f.read(self.CHUNK_SIZE):
+                yield chunk
+        yield self._tail
+
+
+def get_page_token(page_id: str, access_token: str, session: requests.Session) -> str:
+    """Get the page access token, reusing a recently fetched one."""
+    if cached := get_cached_page_token(page_id, access_token):
+        return cached
+    
+    params = {
+        "access_token": access_token,
+        "fields": "access_token",
+    }
+    
+    response = session.get(graph_url(page_id), params=params, timeout=DEFAULT_TIMEOUT)
+    check_token_error(response)
+    response.raise_for_status()
+    
+    page_token = parse_json(response).get("access_token")
+    if not page_token:
+        raise click.ClickException("Could not get page access token")
+    
+    cache_page_token(page_id, access_token, page_token)
+    return page_token
+
+
+def upload_photo_unpublished(
+    photo_path: str,
+    access_token: str,
+    session: requests.Session,
+    page_id: str = "me",
+) -> str:
+    """Upload a photo without publishing, return the photo ID.
+    
+    A failed upload raises requests.HTTPError so callers wrapped in
+    with_retry retry it; turning it into a click error is left to the
+    command.
+    """
+    with open(photo_path, "rb") as f:
+        files = {"source": f}
+        data = {
+            "access_token": access_token,
+            "published": "false",
+        }
+        response = session.post(
+            graph_url(f"{page_id}/photos"), files=files, data=data, timeout=(10, 120)
+        )
+    
+    check_token_error(response)
+    if response.status_code != 200:
+        raise requests.HTTPError(f"Error uploading photo: {extract_error(response)}", response=response)
+    
+    body = parse_json(response)
+    photo_id = body.get("id") if isinstance(body, dict) else None
+    if not photo_id:
+        raise click.ClickException(f"Photo upload returned no ID: {response.text}")
+    return photo_id
@@ -1,25 +1,89 @@
 """Facebook authentication and token management."""
 
+import copy
+import time
 from datetime import datetime
+from functools import wraps
+from typing import Callable
 
 import click
 
 from ..common.auth import ConfigManager
-from ..common.http import get_session, DEFAULT_TIMEOUT
+from ..common.http import get_session, extract_error, parse_json, DEFAULT_TIMEOUT
 
 API_VERSION = "v19.0"
 
+# Graph API endpoints, built once at import
+GRAPH_BASE = f"https://graph.facebook.com/{API_VERSION}"
+TOKEN_URL = f"{GRAPH_BASE}/oauth/access_token"
+
 _config_manager = ConfigManager("facebook")
 
+# Parsed config.json and the st_mtime_ns it was read at
+_CONFIG_CACHE: dict | None = None
+_CONFIG_MTIME: int | None = None
+
+# Graph API error code for an invalid or expired access token
+TOKEN_ERROR_CODE = 190
+
+# Safety margin before the stored expiry at which a token stops being trusted
+_TOKEN_EXPIRY_MARGIN = 300
+
+# (token, deadline) of the last token resolved by get_access_token
+_TOKEN_CACHE: tuple[str, float] | None = None
+
+
+# Page tokens derived from a user token, (page_id, user_token) -> (page_token, deadline)
+PAGE_TOKEN_TTL = 3600
+_PAGE_TOKEN_CACHE: dict[tuple[str, str], tuple[str, float]] = {}
+
+
+def _invalidate_token_cache() -> None:
+    """Forget the in-process access token so the next call re-resolves it."""
+    global _TOKEN_CACHE
+    _TOKEN_CACHE = None
+    _PAGE_TOKEN_CACHE.clear()
+
+
+def get_cached_page_token(page_id: str, access_token: str) -> str | None:
+    """Return a page token previously derived from this user token, if still fresh."""
+    entry = _PAGE_TOKEN_CACHE.get((page_id, access_token))
+    if entry and time.monotonic() < entry[1]:
+        return entry[0]
+    return None
+
+
+def cache_page_token(page_id: str, access_token: str, page_token: str) -> None:
+    """Remember a page token for PAGE_TOKEN_TTL seconds."""
+    _PAGE_TOKEN_CACHE[(page_id, access_token)] = (page_token, time.monotonic() + PAGE_TOKEN_TTL)
+
+
+def _config_mtime() -> int | None:
+    try:
+        return _config_manager.config_file.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
 
 def load_config() -> dict:
-    """Load Facebook config."""
-    return _config_manager.load()
+    """Load Facebook config, reusing the parsed dict while the file is unchanged."""
+    global _CONFIG_CACHE, _CONFIG_MTIME
+    mtime = _config_mtime()
+    if _CONFIG_CACHE is not None and mtime is not None and mtime == _CONFIG_MTIME:
+        return copy.deepcopy(_CONFIG_CACHE)
+    
+    _CONFIG_CACHE = _config_manager.load()
+    _CONFIG_MTIME = mtime
+    # Callers edit the dict in place; the cache only changes via save_config
+    return copy.deepcopy(_CONFIG_CACHE)
 
 
 def save_config(config: dict) -> None:
     """Save Facebook config."""
+    global _CONFIG_CACHE, _CONFIG_MTIME
     _config_manager.save(config)
+    _CONFIG_CACHE = copy.deepcopy(config)
+    _CONFIG_MTIME = _config_mtime()
 
 
 def _validate_token(access_token: str) -> bool:
@@ -28,7 +92,7 @@ def _validate_token(access_token: str) -> bool:
     
     try:
         resp = session.get(
-            f"https://graph.facebook.com/{API_VERSION}/me",
+            f"{GRAPH_BASE}/me",
             params={"access_token": access_token},
             timeout=DEFAULT_TIMEOUT,
         )
@@ -38,7 +102,15 @@ def _validate_token(access_token: str) -> bool:
 
 
 def get_access_token(auto_refresh: bool = True) -> str:
-    """Get the access token, refreshing if needed."""
+    """Get the access token, refreshing if needed.
+    
+    A token with a stored expiry more than five minutes away is cached
+    in-process and returned without re-validating against the Graph API.
+    """
+    global _TOKEN_CACHE
+    if _TOKEN_CACHE and time.time() < _TOKEN_CACHE[1]:
+        return _TOKEN_CACHE[0]
+    
     config = load_config()
     
     if "access_token" not in config:
@@ -55,6 +127,12 @@ def get_access_token(auto_refresh: bool = True) -> str:
             click.echo("Token expired, attempting refresh...")
             return _refresh_token(config)
     
+    # A stored expiry comfortably in the future is trusted without a round-trip
+    expiry = config.get("token_expiry")
+    if expiry and time.time() < expiry - _TOKEN_EXPIRY_MARGIN:
+        _TOKEN_CACHE = (token, expiry - _TOKEN_EXPIRY_MARGIN)
+        return token
+    
     # Validate the token is still working
     if not _validate_token(token):
         click.echo("Token appears invalid, attempting refresh...")
@@ -71,15 +149,16 @@ def get_access_token(auto_refresh: bool = True) -> str:
 
 def _refresh_token(config: dict) -> str:
     """Refresh the access token using app credentials."""
-    if "app_id" not in config or "app_secret" not in config:
+    missing = [k for k in ("app_id", "app_secret", "access_token") if k not in config]
+    if missing:
         raise click.ClickException(
-            "Cannot refresh token: app_id or app_secret missing from config.\n"
+            f"Cannot refresh token: {', '.join(missing)} missing from config.\n"
             "Please run 'vbsocial facebook configure' to set up credentials."
         )
     
     session = get_session()
     
-    url = f"https://graph.facebook.com/{API_VERSION}/oauth/access_token"
+    url = TOKEN_URL
     params = {
         "grant_type": "fb_exchange_token",
         "client_id": config["app_id"],
@@ -95,11 +174,45 @@ def _refresh_token(config: dict) -> str:
         if "expires_in" in data:
             config["token_expiry"] = datetime.now().timestamp() + data["expires_in"]
         save_config(config)
+        _invalidate_token_cache()
         click.echo("✓ Access token refreshed successfully!")
         return config["access_token"]
     else:
+        raise click.ClickException(f"Failed to refresh token: {extract_error(response)}")
+
+
+class TokenRejectedError(click.ClickException):
+    """Raised when the Graph API rejects the access token of a request."""
+
+
+def check_token_error(response) -> None:
+    """Raise TokenRejectedError if a Graph API response rejected the token."""
+    if response.status_code == 200:
+        return
+    try:
+        body = parse_json(response)
+    except ValueError:
+        body = None
+    # Error bodies are normally {"error": {...}}, but don't trust the shape
+    error = body.get("error") if isinstance(body, dict) else None
+    code = error.get("code") if isinstance(error, dict) else None
+    if response.status_code == 401 or code == TOKEN_ERROR_CODE:
+        raise TokenRejectedError(f"Access token rejected: {extract_error(response)}")
+
+
+def refresh_on_token_error(func: Callable) -> Callable:
+    """Retry a Graph API workflow once after refreshing a rejected token.
+    
+    Tokens with a stored expiry are trusted without probing, so a token that
+    was revoked early is only noticed when a real call fails.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
         try:
-            error = response.json().get("error", {}).get("message", response.text)
-        except Exception:
-            error = response.text
-        raise click.ClickException(f"Failed to refresh token: {error}")
+            return func(*args, **kwargs)
+        except TokenRejectedError:
+            click.echo("Token was rejected, attempting refresh...")
+            _invalidate_token_cache()
+            _refresh_token(load_config())
+            return func(*args, **kwargs)
+    return wrapper
@@ -1,13 +1,17 @@
 """Facebook configuration command."""
 
+import time
 from datetime import datetime
 
 import click
 
-from ..auth import save_config, API_VERSION
-from ...common.http import get_session, DEFAULT_TIMEOUT
+from ..auth import save_config, TOKEN_URL
+from ...common.http import get_session, extract_error, DEFAULT_TIMEOUT
 from ...common.config import load_json, get_platform_dir
 
+# Minimum remaining lifetime (30 days) for an existing token to be kept as-is
+_KEEP_TOKEN_MIN_LIFETIME = 30 * 24 * 60 * 60
+
 
 def _get_existing_config() -> dict | None:
     """Try to load existing config."""
@@ -73,11 +77,31 @@ def configure() -> None:
     else:
         page_id = click.prompt("Page ID")
     
+    # A stored long-lived token for the same app can be kept without re-exchanging it
+    can_keep_token = (
+        existing is not None
+        and existing.get("access_token")
+        and (existing.get("app_id"), existing.get("app_secret")) == (app_id, app_secret)
+        and existing.get("token_expiry", 0) - time.time() > _KEEP_TOKEN_MIN_LIFETIME
+    )
+    
     # Get Initial Token
     click.echo("\n🔑 Get a fresh access token from Graph API Explorer:")
     click.echo(f"   https://developers.facebook.com/tools/explorer/?app_id={app_id}")
     click.echo("")
-    initial_token = click.prompt("Access Token (short-lived)")
+    if can_keep_token:
+        initial_token = click.prompt(
+            "Access Token (Enter to keep current)", default="", show_default=False
+        )
+        if not initial_token:
+            if page_id != existing.get("page_id"):
+                save_config({**existing, "page_id": page_id})
+                click.echo("\n✓ Page ID updated; existing token kept.")
+            else:
+                click.echo("\nNo changes, skipping token exchange.")
+            return
+    else:
+        initial_token = click.prompt("Access Token (short-lived)")
     
     config = {
         "app_id": app_id,
@@ -89,7 +113,7 @@ def configure() -> None:
     # Exchange the initial token for a long-lived one
     click.echo("\nExchanging for long-lived token...")
     
-    url = f"https://graph.facebook.com/{API_VERSION}/oauth/access_token"
+    url = TOKEN_URL
     params = {
         "grant_type": "fb_exchange_token",
         "client_id": app_id,
@@ -120,8 +144,4 @@ def configure() -> None:
         click.echo("  vbsocial facebook post photo image.jpg -m 'Caption'")
         click.echo("  vbsocial facebook post video video.mp4 -m 'Caption'")
     else:
-        try:
-            error = response.json().get("error", {}).get("message", response.text)
-        except Exception:
-            error = response.text
-        raise click.ClickException(f"Failed to exchange token: {error}")
+        raise click.ClickException(f"Failed to exchange token: {extract_error(response)}")
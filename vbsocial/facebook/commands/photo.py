@@ -1,18 +1,22 @@
 """Facebook photo posting command."""
 
+import json
+from concurrent.futures import ThreadPoolExecutor
+
 import click
 
-from ..auth import get_access_token, API_VERSION
-from ...common.http import get_session, DEFAULT_TIMEOUT, with_retry
+from .._api import graph_url, upload_photo_unpublished
+from ..auth import get_access_token, check_token_error, refresh_on_token_error
+from ...common.http import get_session, extract_error, DEFAULT_TIMEOUT, with_retry
 
 
-@with_retry(max_attempts=3, delay=1.0)
+@refresh_on_token_error
 def post_photo(photo_path: str, message: str | None) -> dict:
     """Post a photo to Facebook."""
     access_token = get_access_token()
     session = get_session()
     
-    url = f"https://graph.facebook.com/{API_VERSION}/me/photos"
+    url = graph_url("me/photos")
     
     with open(photo_path, "rb") as f:
         files = {"source": f}
@@ -23,32 +27,15 @@ def post_photo(photo_path: str, message: str | None) -> dict:
         
         response = session.post(url, files=files, data=data, timeout=(10, 120))
     
+    check_token_error(response)
     if response.status_code == 200:
         click.echo("Photo posted successfully!")
         return response.json()
     else:
-        raise click.ClickException(f"Error posting photo: {response.text}")
-
-
-def _upload_photo_unpublished(photo_path: str, access_token: str) -> str:
-    """Upload a photo without publishing, return the photo ID."""
-    session = get_session()
-    url = f"https://graph.facebook.com/{API_VERSION}/me/photos"
-    
-    with open(photo_path, "rb") as f:
-        files = {"source": f}
-        data = {
-            "access_token": access_token,
-            "published": "false",
-        }
-        response = session.post(url, files=files, data=data, timeout=(10, 120))
-    
-    if response.status_code != 200:
-        raise click.ClickException(f"Error uploading photo: {response.text}")
-    
-    return response.json()["id"]
+        raise click.ClickException(f"Error posting photo: {extract_error(response)}")
 
 
+@refresh_on_token_error
 @with_retry(max_attempts=2, delay=2.0)
 def post_multiple_photos(photo_paths: list[str], message: str | None) -> dict:
     """Post multiple photos as a single Facebook post."""
@@ -58,16 +45,17 @@ def post_multiple_photos(photo_paths: list[str], message: str | None) -> dict:
     access_token = get_access_token()
     session = get_session()
     
-    # Upload all photos unpublished
-    photo_ids = []
-    for idx, path in enumerate(photo_paths, 1):
-        click.echo(f"  Uploading photo {idx}/{len(photo_paths)}...")
-        photo_id = _upload_photo_unpublished(path, access_token)
-        photo_ids.append(photo_id)
+    # Upload all photos unpublished, in parallel over the shared session pool
+    click.echo(f"  Uploading {len(photo_paths)} photos...")
+    with ThreadPoolExecutor(max_workers=min(8, len(photo_paths))) as executor:
+        photo_ids = list(executor.map(
+            lambda path: upload_photo_unpublished(path, access_token, session),
+            photo_paths,
+        ))
     
     # Create feed post with all photos attached
     click.echo("  Creating multi-photo post...")
-    url = f"https://graph.facebook.com/{API_VERSION}/me/feed"
+    url = graph_url("me/feed")
     
     data = {
         "access_token": access_token,
@@ -76,15 +64,18 @@ def post_multiple_photos(photo_paths: list[str], message: str | None) -> dict:
     
     # Add attached_media for each photo
     for idx, photo_id in enumerate(photo_ids):
-        data[f"attached_media[{idx}]"] = f'{{"media_fbid":"{photo_id}"}}'
+        data[f"attached_media[{idx}]"] = json.dumps(
+            {"media_fbid": photo_id}, separators=(",", ":")
+        )
     
     response = session.post(url, data=data, timeout=DEFAULT_TIMEOUT)
     
+    check_token_error(response)
     if response.status_code == 200:
         click.echo("Multi-photo post created successfully!")
         return response.json()
     else:
-        raise click.ClickException(f"Error creating post: {response.text}")
+        raise click.ClickException(f"Error creating post: {extract_error(response)}")
 
 
 @click.command()
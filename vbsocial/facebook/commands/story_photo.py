@@ -1,49 +1,14 @@
 """Facebook story photo posting command."""
 
 import click
+import requests
 
-from ..auth import get_access_token, load_config, API_VERSION
-from ...common.http import get_session, DEFAULT_TIMEOUT, with_retry
-
-
-def _get_page_token(page_id: str, access_token: str) -> str:
-    """Get the page access token."""
-    session = get_session()
-    
-    url = f"https://graph.facebook.com/{API_VERSION}/{page_id}"
-    params = {
-        "access_token": access_token,
-        "fields": "access_token",
-    }
-    
-    response = session.get(url, params=params, timeout=DEFAULT_TIMEOUT)
-    response.raise_for_status()
-    
-    page_token = response.json().get("access_token")
-    if not page_token:
-        raise click.ClickException("Could not get page access token")
-    
-    return page_token
-
-
-def _upload_to_fb_storage(photo_path: str, access_token: str, page_id: str) -> str:
-    """Upload photo to Facebook and get photo ID."""
-    session = get_session()
-    
-    url = f"https://graph.facebook.com/{API_VERSION}/{page_id}/photos"
-    
-    with open(photo_path, "rb") as f:
-        files = {"source": f}
-        params = {
-            "access_token": access_token,
-            "published": "false",
-        }
-        
-        response = session.post(url, files=files, data=params, timeout=(10, 120))
-        response.raise_for_status()
-        return response.json().get("id")
+from .._api import get_page_token, graph_url, upload_photo_unpublished
+from ..auth import get_access_token, load_config, refresh_on_token_error
+from ...common.http import get_session, parse_json, DEFAULT_TIMEOUT, with_retry
 
 
+@refresh_on_token_error
 @with_retry(max_attempts=3, delay=1.0)
 def post_story_photo(photo_path: str) -> dict:
     """Post a photo to Facebook Story."""
@@ -54,15 +19,15 @@ def post_story_photo(photo_path: str) -> dict:
     session = get_session()
     
     # Get page access token
-    page_token = _get_page_token(page_id, access_token)
+    page_token = get_page_token(page_id, access_token, session)
     
     # Upload the photo
     click.echo("Uploading photo...")
-    photo_id = _upload_to_fb_storage(photo_path, page_token, page_id)
+    photo_id = upload_photo_unpublished(photo_path, page_token, session, page_id)
     click.echo("Photo uploaded, creating story...")
     
     # Create the story
-    url = f"https://graph.facebook.com/{API_VERSION}/{page_id}/photo_stories"
+    url = graph_url(f"{page_id}/photo_stories")
     params = {
         "access_token": page_token,
         "photo_id": photo_id,
@@ -71,7 +36,7 @@ def post_story_photo(photo_path: str) -> dict:
     response = session.post(url, data=params, timeout=DEFAULT_TIMEOUT)
     response.raise_for_status()
     
-    result = response.json()
+    result = parse_json(response)
     if result.get("success"):
         click.echo("Story photo posted successfully!")
         if post_id := result.get("post_id"):
@@ -85,4 +50,7 @@ def post_story_photo(photo_path: str) -> dict:
 @click.argument("photo_path", type=click.Path(exists=True))
 def story_photo(photo_path: str) -> None:
     """Post a photo to Facebook Story."""
-    post_story_photo(photo_path)
+    try:
+        post_story_photo(photo_path)
+    except requests.RequestException as e:
+        raise click.ClickException(str(e))
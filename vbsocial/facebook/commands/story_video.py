@@ -1,38 +1,24 @@
 """Facebook story video posting command."""
 
+import itertools
+import mmap
+import os
+import random
 import time
 
 import click
+import requests
 
-from ..auth import get_access_token, load_config, API_VERSION
-from ...common.http import get_session, DEFAULT_TIMEOUT, with_retry
+from .._api import get_page_token, graph_url
+from ..auth import get_access_token, load_config, refresh_on_token_error
+from ...common.http import get_session, parse_json, DEFAULT_TIMEOUT, with_retry
 
 
-def _get_page_token(page_id: str, access_token: str) -> str:
-    """Get the page access token."""
-    session = get_session()
-    
-    url = f"https://graph.facebook.com/{API_VERSION}/{page_id}"
-    params = {
-        "access_token": access_token,
-        "fields": "access_token",
-    }
-    
-    response = session.get(url, params=params, timeout=DEFAULT_TIMEOUT)
-    response.raise_for_status()
-    
-    page_token = response.json().get("access_token")
-    if not page_token:
-        raise click.ClickException("Could not get page access token")
-    
-    return page_token
-
-
-def _init_video_upload(page_id: str, access_token: str) -> tuple[str, str]:
+def _init_video_upload(
+    page_id: str, access_token: str, session: requests.Session
+) -> tuple[str, str]:
     """Initialize video upload and get upload URL."""
-    session = get_session()
-    
-    url = f"https://graph.facebook.com/{API_VERSION}/{page_id}/video_stories"
+    url = graph_url(f"{page_id}/video_stories")
     params = {
         "access_token": access_token,
         "upload_phase": "start",
@@ -40,44 +26,55 @@ def _init_video_upload(page_id: str, access_token: str) -> tuple[str, str]:
     
     response = session.post(url, data=params, timeout=DEFAULT_TIMEOUT)
     response.raise_for_status()
-    data = response.json()
+    data = parse_json(response)
     
     return data.get("video_id"), data.get("upload_url")
 
 
-def _upload_video_binary(upload_url: str, video_path: str, access_token: str) -> dict:
+def _upload_video_binary(
+    upload_url: str, video_path: str, access_token: str, session: requests.Session
+) -> dict:
     """Upload the video binary data."""
-    session = get_session()
-    
     headers = {"Authorization": f"OAuth {access_token}"}
     
     with open(video_path, "rb") as f:
-        response = session.post(
-            upload_url,
-            headers=headers,
-            data=f,
-            timeout=(10, 600),
-        )
-        response.raise_for_status()
-        return response.json()
+        if os.fstat(f.fileno()).st_size == 0:
+            raise click.ClickException(f"Video file is empty: {video_path}")
+        
+        # Send the mapped file as one buffer so urllib3 hands it straight to
+        # sendall() instead of looping over 16 KiB reads in Python
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as body:
+            response = session.post(
+                upload_url,
+                headers=headers,
+                data=body,
+                timeout=(10, 600),
+            )
+    
+    response.raise_for_status()
+    return parse_json(response)
 
 
-def _check_upload_status(video_id: str, access_token: str, max_wait: int = 300) -> bool:
+def _check_upload_status(
+    video_id: str, access_token: str, session: requests.Session, max_wait: int = 300
+) -> bool:
     """Check the status of video upload and processing."""
-    session = get_session()
-    
-    url = f"https://graph.facebook.com/{API_VERSION}/{video_id}"
+    url = graph_url(video_id)
     params = {
         "access_token": access_token,
-        "fields": "status",
+        "fields": "status{uploading_phase{status},processing_phase{status}}",
     }
     
-    start_time = time.time()
+    start_time = time.monotonic()
     
-    while time.time() - start_time < max_wait:
+    for attempt in itertools.count():
+        elapsed = time.monotonic() - start_time
+        if elapsed >= max_wait:
+            break
+        
         response = session.get(url, params=params, timeout=DEFAULT_TIMEOUT)
         response.raise_for_status()
-        status = response.json().get("status", {})
+        status = parse_json(response).get("status", {})
         
         uploading = status.get("uploading_phase", {}).get("status")
         processing = status.get("processing_phase", {}).get("status")
@@ -86,16 +83,18 @@ def _check_upload_status(video_id: str, access_token: str, max_wait: int = 300)
             return True
         
         click.echo("Video processing... Please wait...")
-        time.sleep(3)
+        # Back off 3s, 5s, 8s, ... up to 30s, jittered so clients don't poll in lockstep
+        pause = min(30, 3 * 1.6 ** attempt) + random.uniform(0, 1)
+        time.sleep(min(pause, max(0, max_wait - elapsed)))
     
     raise click.ClickException("Video processing timed out")
 
 
-def _finish_video_upload(page_id: str, video_id: str, access_token: str) -> dict:
+def _finish_video_upload(
+    page_id: str, video_id: str, access_token: str, session: requests.Session
+) -> dict:
     """Finish the video upload process."""
-    session = get_session()
-    
-    url = f"https://graph.facebook.com/{API_VERSION}/{page_id}/video_stories"
+    url = graph_url(f"{page_id}/video_stories")
     params = {
         "access_token": access_token,
         "upload_phase": "finish",
@@ -104,9 +103,10 @@ def _finish_video_upload(page_id: str, video_id: str, access_token: str) -> dict
     
     response = session.post(url, data=params, timeout=DEFAULT_TIMEOUT)
     response.raise_for_status()
-    return response.json()
+    return parse_json(response)
 
 
+@refresh_on_token_error
 @with_retry(max_attempts=2, delay=2.0)
 def post_story_video(video_path: str) -> dict:
     """Post a video to Facebook Story."""
@@ -114,24 +114,26 @@ def post_story_video(video_path: str) -> dict:
     access_token = get_access_token()
     page_id = config["page_id"]
     
+    session = get_session()
+    
     # Get page access token
-    page_token = _get_page_token(page_id, access_token)
+    page_token = get_page_token(page_id, access_token, session)
     
     # Initialize the upload
     click.echo("Initializing video upload...")
-    video_id, upload_url = _init_video_upload(page_id, page_token)
+    video_id, upload_url = _init_video_upload(page_id, page_token, session)
     
     # Upload the video binary
     click.echo("Uploading video...")
-    _upload_video_binary(upload_url, video_path, page_token)
+    _upload_video_binary(upload_url, video_path, page_token, session)
     
     # Check upload status
     click.echo("Checking upload status...")
-    _check_upload_status(video_id, page_token)
+    _check_upload_status(video_id, page_token, session)
     
     # Finish the upload
     click.echo("Finalizing story...")
-    result = _finish_video_upload(page_id, video_id, page_token)
+    result = _finish_video_upload(page_id, video_id, page_token, session)
     
     if result.get("success"):
         click.echo("Story video posted successfully!")
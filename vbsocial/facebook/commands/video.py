@@ -2,32 +2,38 @@
 
 import click
 
-from ..auth import get_access_token, API_VERSION
-from ...common.http import get_session, with_retry
+from .._api import StreamingMultipart, graph_url
+from ..auth import get_access_token, check_token_error, refresh_on_token_error
+from ...common.http import get_session, extract_error
 
 
-@with_retry(max_attempts=2, delay=2.0)
+@refresh_on_token_error
 def post_video(video_path: str, message: str | None) -> dict:
     """Post a video to Facebook."""
     access_token = get_access_token()
     session = get_session()
     
-    url = f"https://graph.facebook.com/{API_VERSION}/me/videos"
+    url = graph_url("me/videos")
     
-    with open(video_path, "rb") as f:
-        files = {"source": f}
-        data = {
-            "access_token": access_token,
-            "description": message or "",
-        }
-        
-        response = session.post(url, files=files, data=data, timeout=(10, 600))
+    body = StreamingMultipart(
+        {"access_token": access_token, "description": message or ""},
+        "source",
+        video_path,
+    )
     
+    response = session.post(
+        url,
+        data=body,
+        headers={"Content-Type": body.content_type},
+        timeout=(10, 600),
+    )
+    
+    check_token_error(response)
     if response.status_code == 200:
         click.echo("Video posted successfully!")
         return response.json()
     else:
-        raise click.ClickException(f"Error posting video: {response.text}")
+        raise click.ClickException(f"Error posting video: {extract_error(response)}")
 
 
 @click.command()
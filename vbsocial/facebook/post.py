@@ -1,18 +1,19 @@
 import click
-from .commands.photo import photo
-from .commands.video import video
-from .commands.story_photo import story_photo
-from .commands.story_video import story_video
+
+from ..common.cli import LazyGroup
 
 CONTEXT_SETTINGS = dict(help_option_names=['-h', '--help'])
 
 
-@click.group(context_settings=CONTEXT_SETTINGS)
+@click.group(
+    cls=LazyGroup,
+    context_settings=CONTEXT_SETTINGS,
+    lazy_subcommands={
+        "photo": "vbsocial.facebook.commands.photo:photo",
+        "video": "vbsocial.facebook.commands.video:video",
+        "story-photo": "vbsocial.facebook.commands.story_photo:story_photo",
+        "story-video": "vbsocial.facebook.commands.story_video:story_video",
+    },
+)
 def post():
     pass
-
-
-post.add_command(photo)
-post.add_command(video)
-post.add_command(story_photo)
-post.add_command(story_video)
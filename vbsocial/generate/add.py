@@ -1,80 +1,150 @@
 """Add components to an existing post directory."""
 
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from os.path import lexists
 from pathlib import Path
+from typing import Callable
 
 import click
-import yaml
 
-from ..agents.datamodel import generate_datamodel
-from ..agents.tikz import generate_tikz
+from ..common.files import mtime_is_trustworthy, read_text_cached, write_text_fd
+from ..common.yaml_utils import yaml_classes
 from ..agents.debug import debug_enabled, log_debug
+from ..agents.workers import with_event_loop
 from .templates import (
     create_idea_slide,
     create_solution_slide,
     get_code_file_extension,
     assemble_modular_document,
     has_diagram_reference,
+    mentions_diagram,
     replace_item_with_lambda,
 )
 
+# Component .tex files, in document order
+_TEX_COMPONENTS = ("problem", "solution", "idea", "alternate", "diagram")
+
+# Data model languages and their file extensions, in reference-preference order
+_LANG_EXT = {"rust": "rs", "python": "py", "swift": "swift", "c": "c", "zig": "zig", "go": "go"}
+_EXT_LANG = {ext: lang for lang, ext in _LANG_EXT.items()}
+
 
 def read_problem_solution(post_path: Path) -> tuple[str, str]:
     """Read problem and solution from existing tex files."""
-    problem = ""
-    solution = ""
-    
-    problem_file = post_path / "problem.tex"
-    solution_file = post_path / "solution.tex"
-    
-    if problem_file.exists():
-        problem = problem_file.read_text()
-    
-    if solution_file.exists():
-        solution = solution_file.read_text()
-    
-    return problem, solution
+    return (
+        read_text_cached(post_path / "problem.tex"),
+        read_text_cached(post_path / "solution.tex"),
+    )
 
 
 def update_main_tex(post_path: Path, components: list[str]) -> None:
     """Update main.tex with new components."""
     latex_content = assemble_modular_document(components, post_path=str(post_path))
-    (post_path / "main.tex").write_text(latex_content)
+    write_text_fd(post_path / "main.tex", latex_content)
+
+
+def _load_yaml(path: str) -> dict:
+    """Parse a YAML file, treating an empty file as {}."""
+    import yaml
+    
+    loader, _ = yaml_classes()
+    with open(path) as f:
+        return yaml.load(f, Loader=loader) or {}
+
+
+@functools.lru_cache(maxsize=32)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> dict:
+    """_load_yaml cached per file version; mtime_ns and size only key the cache."""
+    return _load_yaml(path)
+
+
+def _literal_str_representer(dumper, data: str):
+    """Represent multiline strings in literal block style (cleaner captions)."""
+    if "\n" in data:
+        return dumper.represent_scalar("tag:yaml.org,2002:str", data, style="|")
+    return dumper.represent_scalar("tag:yaml.org,2002:str", data)
+
+
+@functools.cache
+def _post_yaml_dumper() -> type:
+    """Safe dumper for post.yaml, registered once and without touching PyYAML's globals."""
+    _, base = yaml_classes()
+    
+    class PostYamlDumper(base):
+        pass
+    
+    PostYamlDumper.add_representer(str, _literal_str_representer)
+    return PostYamlDumper
 
 
-def update_post_yaml(post_path: Path, components: list[str]) -> None:
-    """Update post.yaml with new components list."""
+def load_post_yaml(post_path: Path) -> dict:
+    """Load post.yaml, parsing it at most once per file version.
+    
+    A file modified within the last mtime tick is always re-parsed, since a
+    rewrite in the same tick can leave mtime and size unchanged. Returns a
+    shallow copy, so callers may set top-level keys freely.
+    """
+    yaml_path = post_path / "post.yaml"
+    try:
+        st = yaml_path.stat()
+    except FileNotFoundError:
+        return {}
+    if not mtime_is_trustworthy(st):
+        return _load_yaml(str(yaml_path))
+    return dict(_load_yaml_cached(str(yaml_path), st.st_mtime_ns, st.st_size))
+
+
+def update_post_yaml(post_path: Path, components: list[str], config: dict | None = None) -> None:
+    """Update post.yaml with new components list.
+    
+    Args:
+        post_path: Post directory
+        components: Component names to record
+        config: Already-loaded post.yaml contents to write back (loaded if omitted)
+    """
     yaml_path = post_path / "post.yaml"
-    if yaml_path.exists():
-        with open(yaml_path) as f:
-            config = yaml.safe_load(f) or {}
-    else:
-        config = {}
+    if config is None:
+        config = load_post_yaml(post_path)
+    
+    import yaml
     
     config["components"] = components
     
-    with open(yaml_path, "w") as f:
-        yaml.dump(config, f, default_flow_style=False, allow_unicode=True)
+    payload = yaml.dump(
+        config, Dumper=_post_yaml_dumper(), default_flow_style=False, allow_unicode=True, width=120
+    ).encode()
+    try:
+        if yaml_path.read_bytes() == payload:
+            return  # unchanged; leave the file (and its mtime) alone
+    except FileNotFoundError:
+        pass
+    yaml_path.write_bytes(payload)
 
 
-def get_existing_components(post_path: Path) -> list[str]:
-    """Get list of existing component files."""
-    components = []
-    
-    if (post_path / "problem.tex").exists():
-        components.append("problem")
-    if (post_path / "solution.tex").exists():
-        components.append("solution")
-    if (post_path / "idea.tex").exists():
-        components.append("idea")
-    if (post_path / "alternate.tex").exists():
-        components.append("alternate")
-    if (post_path / "diagram.tex").exists():
-        components.append("diagram")
+def list_names(path: Path) -> set[str]:
+    """Names of the entries in a directory, from a single scandir pass."""
+    with os.scandir(path) as entries:
+        return {entry.name for entry in entries}
+
+
+def get_existing_components(post_path: Path, names: set[str] | None = None) -> list[str]:
+    """Get list of existing component files.
+    
+    Args:
+        post_path: Post directory
+        names: Entries already listed from post_path (see list_names)
+    """
+    # One directory scan instead of a stat() per candidate file
+    if names is None:
+        names = list_names(post_path)
+    
+    components = [name for name in _TEX_COMPONENTS if f"{name}.tex" in names]
     
     # Check for datamodel files (no separate code_*.tex anymore)
-    for lang, ext in [("rust", "rs"), ("python", "py"), ("swift", "swift"), ("c", "c"), ("zig", "zig"), ("go", "go")]:
-        if (post_path / f"datamodel.{ext}").exists():
-            components.append(lang)
+    found = {_EXT_LANG.get(name[len("datamodel."):]) for name in names if name.startswith("datamodel.")}
+    components.extend(lang for lang in _LANG_EXT if lang in found)
     
     return components
 
@@ -104,8 +174,6 @@ def add_component(post_path: Path, idea: bool, alternate: bool, code: str | None
         vbsocial add --code rust --force  # regenerate existing
         vbsocial add -c rust -d  # debug mode
     """
-    import os
-    
     # Enable debug mode if flag is set
     if debug:
         os.environ["VBSOCIAL_DEBUG"] = "1"
@@ -116,7 +184,7 @@ def add_component(post_path: Path, idea: bool, alternate: bool, code: str | None
         raise click.ClickException("Specify at least one: --idea, --alternate, --code, or --tikz")
     
     # Check if this is a valid post directory
-    if not (post_path / "problem.tex").exists():
+    if not lexists(post_path / "problem.tex"):
         raise click.ClickException(f"Not a valid post directory: {post_path} (no problem.tex)")
     
     click.echo(f"\n📁 Post directory: {post_path}")
@@ -140,6 +208,14 @@ def add_component(post_path: Path, idea: bool, alternate: bool, code: str | None
     components = get_existing_components(post_path)
     click.echo(f"  Existing components: {', '.join(components)}")
     
+    # Parsed once; written back with the new components at the end
+    post_config = load_post_yaml(post_path)
+    
+    # Decide what to generate first; the agent calls are independent network
+    # round-trips, so they then run concurrently and results are written in order.
+    # Each job: (component, filename, runner, message if empty, failure prefix)
+    jobs: list[tuple[str, str, Callable[[], str | None], str | None, str]] = []
+    
     # Add idea
     if idea:
         if "idea" in components and not force:
@@ -148,21 +224,14 @@ def add_component(post_path: Path, idea: bool, alternate: bool, code: str | None
             click.echo("  ⚠️  No solution.tex, cannot generate idea")
         else:
             click.echo("\n💡 Generating key idea...")
-            try:
+            
+            def run_idea() -> str | None:
                 from vbagent.agents.idea import generate_idea_latex
                 # Combine problem and solution for idea extraction
-                full_content = problem + "\n\n" + solution
-                idea_latex = generate_idea_latex(full_content)
-                if idea_latex:
-                    idea_slide = create_idea_slide(idea_latex)
-                    (post_path / "idea.tex").write_text(idea_slide)
-                    if "idea" not in components:
-                        components.append("idea")
-                    click.echo("  ✓ Created idea.tex")
-                else:
-                    click.echo("  ⚠️  No ideas extracted")
-            except Exception as e:
-                click.echo(f"  ❌ Failed: {e}")
+                idea_latex = generate_idea_latex(problem + "\n\n" + solution)
+                return create_idea_slide(idea_latex) if idea_latex else None
+            
+            jobs.append(("idea", "idea.tex", run_idea, "⚠️  No ideas extracted", "❌ Failed"))
     
     # Add alternate
     if alternate:
@@ -172,130 +241,107 @@ def add_component(post_path: Path, idea: bool, alternate: bool, code: str | None
             click.echo("  ⚠️  No solution.tex, cannot generate alternate")
         else:
             click.echo("\n🔄 Generating alternate solution...")
-            try:
+            
+            def run_alternate() -> str | None:
                 from vbagent.agents.alternate import generate_alternate
                 alt = generate_alternate(problem, solution)
-                if alt:
-                    alt_slide = create_solution_slide(alt)
-                    (post_path / "alternate.tex").write_text(alt_slide)
-                    if "alternate" not in components:
-                        components.append("alternate")
-                    click.echo("  ✓ Created alternate.tex")
-                else:
-                    click.echo("  ⚠️  No alternate generated")
-            except Exception as e:
-                click.echo(f"  ❌ Failed: {e}")
+                return create_solution_slide(alt) if alt else None
+            
+            jobs.append(("alternate", "alternate.tex", run_alternate, "⚠️  No alternate generated", "❌ Failed"))
     
     # Add tikz diagram
+    source_images = post_config.get("source_images", [])
+    image_path = source_images[0] if source_images else None
     if tikz:
-        tikz_file = post_path / "diagram.tex"
-        if tikz_file.exists() and not force:
+        if "diagram" in components and not force:
             click.echo("  ⚠️  diagram.tex already exists, use --force to overwrite")
         else:
             click.echo("\n🎨 Generating TikZ diagram...")
-            try:
-                # Check if there's a source image with diagram
-                import yaml
-                yaml_path = post_path / "post.yaml"
-                image_path = None
-                has_diagram = False
-                
-                if yaml_path.exists():
-                    with open(yaml_path) as f:
-                        config = yaml.safe_load(f) or {}
-                    source_images = config.get("source_images", [])
-                    if source_images:
-                        image_path = source_images[0]
-                        # Check if problem mentions diagram/figure
-                        has_diagram = any(kw in problem.lower() for kw in ["diagram", "figure", "shown", "given"])
-                
-                tikz_code = generate_tikz(
-                    problem=problem,
-                    solution=solution,
-                    image_path=image_path,
-                    has_diagram=has_diagram,
-                )
-                if tikz_code:
-                    tikz_file.write_text(tikz_code)
-                    if "diagram" not in components:
-                        components.append("diagram")
-                    click.echo("  ✓ Created diagram.tex")
-                else:
-                    click.echo("  ⚠️  No diagram generated")
-            except Exception as e:
-                click.echo(f"  ❌ Failed: {e}")
-    
-    # Auto-generate diagram if problem references it but file doesn't exist
-    if not tikz and has_diagram_reference(problem) and "diagram" not in components:
-        click.echo("\n🎨 Auto-generating TikZ diagram (referenced in problem)...")
-        try:
-            import yaml
-            yaml_path = post_path / "post.yaml"
-            image_path = None
-            has_diagram = any(kw in problem.lower() for kw in ["diagram", "figure", "shown", "given", "cylindrical", "piston"])
-            
-            if yaml_path.exists():
-                with open(yaml_path) as f:
-                    config = yaml.safe_load(f) or {}
-                source_images = config.get("source_images", [])
-                if source_images:
-                    image_path = source_images[0]
+            from ..agents.tikz import generate_tikz
             
-            tikz_code = generate_tikz(
+            # Only hint at a diagram when there's a source image to draw from
+            has_diagram = image_path is not None and mentions_diagram(problem)
+            run_tikz = functools.partial(
+                generate_tikz,
                 problem=problem,
                 solution=solution,
                 image_path=image_path,
                 has_diagram=has_diagram,
             )
-            if tikz_code:
-                (post_path / "diagram.tex").write_text(tikz_code)
-                components.append("diagram")
-                click.echo("  ✓ Created diagram.tex")
-        except Exception as e:
-            click.echo(f"  ⚠️  Diagram generation failed: {e}")
+            jobs.append(("diagram", "diagram.tex", run_tikz, "⚠️  No diagram generated", "❌ Failed"))
+    
+    # Auto-generate diagram if problem references it but file doesn't exist
+    elif has_diagram_reference(problem) and "diagram" not in components:
+        click.echo("\n🎨 Auto-generating TikZ diagram (referenced in problem)...")
+        from ..agents.tikz import generate_tikz
+        
+        run_tikz = functools.partial(
+            generate_tikz,
+            problem=problem,
+            solution=solution,
+            image_path=image_path,
+            has_diagram=mentions_diagram(problem),
+        )
+        jobs.append(("diagram", "diagram.tex", run_tikz, None, "⚠️  Diagram generation failed"))
     
     # Add code - just save datamodel.{ext}, no separate tex file
     if code:
         ext = get_code_file_extension(code)
-        datamodel_file = post_path / f"datamodel.{ext}"
         if code in components and not force:
             click.echo(f"  ⚠️  datamodel.{ext} already exists, use --force to overwrite")
         else:
             click.echo(f"\n💻 Generating {code} data model...")
-            try:
-                # Find existing code for reference (consistency)
+            from ..agents.datamodel import generate_datamodel
+            
+            # Find existing code for reference (consistency)
+            reference_lang = next((lang for lang in _LANG_EXT if lang != code and lang in components), None)
+            if reference_lang:
+                click.echo(f"  Using {reference_lang} as reference for consistency")
+            
+            def run_code() -> str | None:
+                # Read inside the job so an I/O error is reported as a failed job
                 reference_code = None
-                reference_lang = None
-                for lang, lang_ext in [("rust", "rs"), ("python", "py"), ("swift", "swift"), ("c", "c"), ("zig", "zig"), ("go", "go")]:
-                    if lang != code:
-                        ref_file = post_path / f"datamodel.{lang_ext}"
-                        if ref_file.exists():
-                            reference_code = ref_file.read_text()
-                            reference_lang = lang
-                            click.echo(f"  Using {lang} as reference for consistency")
-                            break
-                
-                datamodel = generate_datamodel(
+                if reference_lang:
+                    reference_code = (post_path / f"datamodel.{_LANG_EXT[reference_lang]}").read_text()
+                return generate_datamodel(
                     problem=problem,
                     language=code,
                     solution=solution,
                     reference_code=reference_code,
                     reference_language=reference_lang,
                 )
-                if datamodel:
-                    datamodel_file.write_text(datamodel)
-                    if code not in components:
-                        components.append(code)
-                    click.echo(f"  ✓ Created datamodel.{ext}")
-                else:
-                    click.echo("  ⚠️  No code generated")
-            except Exception as e:
-                click.echo(f"  ❌ Failed: {e}")
+            jobs.append((code, f"datamodel.{ext}", run_code, "⚠️  No code generated", "❌ Failed"))
+    
+    if jobs:
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = [executor.submit(with_event_loop(job[2])) for job in jobs]
+            failures: list[tuple[str, str, Exception]] = []
+            for (component, filename, _, empty_msg, fail_msg), future in zip(jobs, futures):
+                try:
+                    content = future.result()
+                except Exception as e:
+                    failures.append((filename, fail_msg, e))
+                    continue
+                if content:
+                    write_text_fd(post_path / filename, content)
+                    if component not in components:
+                        components.append(component)
+                    click.echo(f"  ✓ Created {filename}")
+                elif empty_msg:
+                    click.echo(f"  {empty_msg}")
+        
+        # A shared cause (bad API key, network down) is reported once, not per job
+        if len(failures) > 1 and len({(type(e), str(e)) for _, _, e in failures}) == 1:
+            names = ", ".join(filename for filename, _, _ in failures)
+            click.echo(f"  ❌ {names} all failed with the same error: {failures[0][2]}")
+        else:
+            for _, fail_msg, e in failures:
+                click.echo(f"  {fail_msg}: {e}")
     
     # Update main.tex and post.yaml
     click.echo("\n📄 Updating main.tex...")
     update_main_tex(post_path, components)
-    update_post_yaml(post_path, components)
+    update_post_yaml(post_path, components, post_config)
     click.echo(f"  Components: {', '.join(components)}")
     
     # Render if requested
@@ -305,7 +351,8 @@ def add_component(post_path: Path, idea: bool, alternate: bool, code: str | None
         subprocess.run(
             ["pdflatex", "-shell-escape", "-interaction=nonstopmode", "main.tex"],
             cwd=post_path,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
         
         if (post_path / "main.pdf").exists():
@@ -346,13 +393,14 @@ def fix_post(post_path: Path, diagram: bool, lambda_item: bool, caption: bool, f
     if fix_all:
         diagram = lambda_item = caption = True
     
-    if not (post_path / "problem.tex").exists():
+    if not lexists(post_path / "problem.tex"):
         raise click.ClickException(f"Not a valid post directory: {post_path} (no problem.tex)")
     
     click.echo(f"\n🔧 Fixing post: {post_path}")
     
     problem, solution = read_problem_solution(post_path)
     components = get_existing_components(post_path)
+    post_config = load_post_yaml(post_path)
     modified = False
     
     # Fix lambda item
@@ -360,7 +408,7 @@ def fix_post(post_path: Path, diagram: bool, lambda_item: bool, caption: bool, f
         original = problem
         problem = replace_item_with_lambda(problem)
         if problem != original:
-            (post_path / "problem.tex").write_text(problem)
+            write_text_fd(post_path / "problem.tex", problem)
             click.echo("  ✓ Replaced \\item with \\item[$\\lambda.$]")
             modified = True
         else:
@@ -370,16 +418,14 @@ def fix_post(post_path: Path, diagram: bool, lambda_item: bool, caption: bool, f
     if diagram and has_diagram_reference(problem) and "diagram" not in components:
         click.echo("\n🎨 Generating missing diagram.tex...")
         try:
-            yaml_path = post_path / "post.yaml"
             image_path = None
-            has_diag = any(kw in problem.lower() for kw in ["diagram", "figure", "shown", "given", "cylindrical", "piston"])
+            has_diag = mentions_diagram(problem)
             
-            if yaml_path.exists():
-                with open(yaml_path) as f:
-                    config = yaml.safe_load(f) or {}
-                source_images = config.get("source_images", [])
-                if source_images:
-                    image_path = source_images[0]
+            source_images = post_config.get("source_images", [])
+            if source_images:
+                image_path = source_images[0]
+            
+            from ..agents.tikz import generate_tikz
             
             tikz_code = generate_tikz(
                 problem=problem,
@@ -388,7 +434,7 @@ def fix_post(post_path: Path, diagram: bool, lambda_item: bool, caption: bool, f
                 has_diagram=has_diag,
             )
             if tikz_code:
-                (post_path / "diagram.tex").write_text(tikz_code)
+                write_text_fd(post_path / "diagram.tex", tikz_code)
                 components.append("diagram")
                 click.echo("  ✓ Created diagram.tex")
                 modified = True
@@ -408,29 +454,9 @@ def fix_post(post_path: Path, diagram: bool, lambda_item: bool, caption: bool, f
             
             captions = generate_captions_from_post(str(post_path))
             
-            # Save to post.yaml for post-all command
-            yaml_path = post_path / "post.yaml"
-            if yaml_path.exists():
-                with open(yaml_path) as f:
-                    post_config = yaml.safe_load(f) or {}
-            else:
-                post_config = {}
-            
-            # Add captions to post.yaml
+            # Saved to post.yaml (for post-all) with the components below
             post_config["captions"] = captions
-            
-            # Custom representer for literal block style (cleaner multiline)
-            def str_representer(dumper, data):
-                if '\n' in data:
-                    return dumper.represent_scalar('tag:yaml.org,2002:str', data, style='|')
-                return dumper.represent_scalar('tag:yaml.org,2002:str', data)
-            
-            yaml.add_representer(str, str_representer)
-            
-            with open(yaml_path, "w") as f:
-                yaml.dump(post_config, f, default_flow_style=False, allow_unicode=True, width=120)
-            
-            click.echo("  ✓ Saved captions to post.yaml")
+            click.echo("  ✓ Generated captions")
             
             # Show preview
             click.echo("\n  📱 Caption previews:")
@@ -449,7 +475,8 @@ def fix_post(post_path: Path, diagram: bool, lambda_item: bool, caption: bool, f
     if modified:
         click.echo("\n📄 Updating main.tex...")
         update_main_tex(post_path, components)
-        update_post_yaml(post_path, components)
+        update_post_yaml(post_path, components, post_config)
+        click.echo("  ✓ Updated main.tex and post.yaml")
     
     # Render if requested
     if render and modified:
@@ -458,7 +485,8 @@ def fix_post(post_path: Path, diagram: bool, lambda_item: bool, caption: bool, f
         subprocess.run(
             ["pdflatex", "-shell-escape", "-interaction=nonstopmode", "main.tex"],
             cwd=post_path,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
         
         if (post_path / "main.pdf").exists():
@@ -1,13 +1,17 @@
 """Assemble main.tex from existing component files."""
 
+import os
+from os.path import lexists
 from pathlib import Path
 import shutil
 import subprocess
 
 import click
 
-from .templates import assemble_modular_document, get_code_file_extension
-from .add import get_existing_components, update_post_yaml
+from .templates import CODE_LANGS, assemble_modular_document, get_code_file_extension
+from .bg_gen import NAMED_COLORS
+from .add import get_existing_components, list_names, update_post_yaml
+from ..common.files import read_text_fd, write_text_fd
 from ..agents.debug import debug_enabled, log_debug
 
 
@@ -23,42 +27,50 @@ def resolve_color(color: str) -> str:
     if color.startswith("#"):
         return color.lstrip("#")
     
-    # Named colors
-    color_map = {
-        "maroon": "B62F54",
-        "black": "000000",
-        "white": "FFFFFF",
-        "skin": "FCEDDB",
-        "matteblack": "1a1a1a",
-    }
-    
-    return color_map.get(color.lower(), "B62F54")  # Default to maroon
+    return NAMED_COLORS.get(color.lower(), NAMED_COLORS["maroon"])  # Default to maroon
 
 
-def copy_post_sty(post_path: Path) -> None:
-    """Copy post.sty to the post directory if not present."""
+def copy_post_sty(post_path: Path, existing: set[str] | None = None) -> None:
+    """Copy post.sty to the post directory if not present.
+    
+    Args:
+        post_path: Post directory
+        existing: Names already listed from post_path, to skip the stat
+    """
     sty_dest = post_path / "post.sty"
-    if not sty_dest.exists():
-        sty_src = Path(__file__).parent / "post.sty"
-        if sty_src.exists():
-            shutil.copy(sty_src, sty_dest)
+    present = "post.sty" in existing if existing is not None else lexists(sty_dest)
+    if present:
+        return
+    
+    # copyfile skips shutil.copy's extra stat and permission copy; a missing
+    # bundled post.sty is not an error
+    try:
+        shutil.copyfile(Path(__file__).parent / "post.sty", sty_dest)
+    except FileNotFoundError:
+        pass
 
 
 def preview_content(content: str, head: int = 30, tail: int = 30) -> str:
     """Get preview of content: first N chars ... last N chars."""
-    content = content.strip()
-    if len(content) <= head + tail + 10:
-        return content
-    return f"{content[:head]}...{content[-tail:]}"
+    # Walk only the surrounding whitespace; lstrip()/rstrip() would each copy
+    # nearly the whole string just to measure it
+    start, end = 0, len(content)
+    while start < end and content[start].isspace():
+        start += 1
+    while end > start and content[end - 1].isspace():
+        end -= 1
+    if end - start <= head + tail + 10:
+        return content[start:end]
+    return f"{content[start:start + head]}...{content[end - tail:end]}"
 
 
-def log_component(name: str, filename: str, content: str) -> None:
-    """Log a component being added."""
+def log_component(name: str, filename: str, content: str, preview: str | None = None) -> None:
+    """Log a component being added (pass `preview` if already computed)."""
     if not debug_enabled():
         return
     log_debug("component", {
         "file": filename,
-        "preview": preview_content(content),
+        "preview": preview if preview is not None else preview_content(content),
         "length": len(content),
     })
 
@@ -105,13 +117,12 @@ def assemble(post_path: Path, title: str, code_theme: str, fg_color: str, list_t
         click.echo(list_all_themes())
         return
     
-    import os
-    
     # Enable debug mode if flag is set
     if debug:
         os.environ["VBSOCIAL_DEBUG"] = "1"
         from ..agents.debug import reset_debug_cache
         reset_debug_cache()
+    dbg = debug_enabled()
     
     # Resolve theme name
     theme = get_theme(code_theme)
@@ -119,51 +130,54 @@ def assemble(post_path: Path, title: str, code_theme: str, fg_color: str, list_t
     # Resolve foreground color (hex or name)
     fg_hex = resolve_color(fg_color)
     
+    # List the post directory once for the checks below
+    existing = list_names(post_path)
+    
     # Check if valid post directory
-    if not (post_path / "problem.tex").exists():
+    if "problem.tex" not in existing:
         raise click.ClickException(f"Not a valid post directory: {post_path} (no problem.tex)")
     
     click.echo(f"\n📁 Post directory: {post_path}")
     click.echo(f"  Code theme: {theme}")
     click.echo(f"  Foreground color: #{fg_hex}")
     
-    if debug_enabled():
+    if dbg:
         log_debug("assemble_start", {"post_path": str(post_path), "title": title, "code_theme": theme, "fg_color": fg_hex})
     
     # Get existing components
-    components = get_existing_components(post_path)
+    components = get_existing_components(post_path, existing)
     click.echo(f"  Found components: {', '.join(components)}")
     
     if not components:
         raise click.ClickException("No component files found")
     
     # Log each component's content preview
-    if debug_enabled():
+    if dbg:
         click.echo("\n🐛 DEBUG: Component contents:")
         for comp in components:
             # Determine file path
-            if comp in ("rust", "python", "swift", "c", "zig", "go", "cpp"):
+            if comp in CODE_LANGS:
                 ext = get_code_file_extension(comp)
                 filename = f"datamodel.{ext}"
             else:
                 filename = f"{comp}.tex"
             
-            file_path = post_path / filename
-            if file_path.exists():
-                content = file_path.read_text()
-                log_component(comp, filename, content)
-                click.echo(f"  [{filename}] {preview_content(content)}")
+            # get_existing_components only lists files it found on disk
+            content = read_text_fd(post_path / filename)
+            preview = preview_content(content)
+            log_component(comp, filename, content, preview)
+            click.echo(f"  [{filename}] {preview}")
     
     # Copy post.sty
-    copy_post_sty(post_path)
+    copy_post_sty(post_path, existing)
     
     # Generate main.tex
     click.echo("\n📄 Generating main.tex...")
     latex_content = assemble_modular_document(components, title=title, post_path=str(post_path), code_theme=theme, fg_color=fg_hex)
-    (post_path / "main.tex").write_text(latex_content)
+    write_text_fd(post_path / "main.tex", latex_content)
     
     # Log main.tex
-    if debug_enabled():
+    if dbg:
         click.echo("\n🐛 DEBUG: main.tex content:")
         click.echo("-" * 60)
         click.echo(latex_content)
@@ -172,8 +186,8 @@ def assemble(post_path: Path, title: str, code_theme: str, fg_color: str, list_t
     
     # Log code.tex if it was generated
     code_tex_path = post_path / "code.tex"
-    if code_tex_path.exists() and debug_enabled():
-        code_content = code_tex_path.read_text()
+    if dbg and lexists(code_tex_path):
+        code_content = read_text_fd(code_tex_path)
         click.echo("\n🐛 DEBUG: code.tex content:")
         click.echo("-" * 60)
         click.echo(code_content)
@@ -188,11 +202,18 @@ def assemble(post_path: Path, title: str, code_theme: str, fg_color: str, list_t
     # Render if requested
     if render:
         click.echo("\n🖼️  Rendering...")
-        subprocess.run(
-            ["pdflatex", "-shell-escape", "-interaction=nonstopmode", "main.tex"],
+        # Single pass; batchmode skips terminal output we would discard anyway,
+        # debug mode keeps it (nonstopmode) and logs the tail
+        interaction = "nonstopmode" if dbg else "batchmode"
+        output = {"capture_output": True, "text": True} if dbg else {"stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL}
+        result = subprocess.run(
+            ["pdflatex", "-shell-escape", f"-interaction={interaction}", "main.tex"],
             cwd=post_path,
-            capture_output=True,
+            stdin=subprocess.DEVNULL,
+            **output,
         )
+        if dbg:
+            log_debug("pdflatex", {"returncode": result.returncode, "output": result.stdout[-2000:]})
         
         pdf_path = post_path / "main.pdf"
         images_dir = post_path / "images"
@@ -209,7 +230,7 @@ def assemble(post_path: Path, title: str, code_theme: str, fg_color: str, list_t
                 )
             
             from .render import render_pdf_to_pngs
-            render_pdf_to_pngs(
+            images = render_pdf_to_pngs(
                 pdf_path=pdf_path,
                 output_dir=images_dir,
                 dpi=320,
@@ -221,16 +242,14 @@ def assemble(post_path: Path, title: str, code_theme: str, fg_color: str, list_t
             click.echo("  ✓ Rendered images")
             
             # Open images folder with 'open' (macOS Finder)
-            if preview and images_dir.exists():
-                images = sorted(images_dir.glob("*.png"))
-                if images:
-                    click.echo(f"  📖 Opening images folder...")
-                    subprocess.Popen(
-                        ["open", str(images_dir)],
-                        start_new_session=True,
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL,
-                    )
+            if preview and images:
+                click.echo(f"  📖 Opening images folder...")
+                subprocess.Popen(
+                    ["open", str(images_dir)],
+                    start_new_session=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
         else:
             click.echo("  ⚠️  PDF not created, check LaTeX errors")
     
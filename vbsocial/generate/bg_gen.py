@@ -1,17 +1,25 @@
-"""Generate background PNG from LaTeX template."""
+"""Generate solid-color background PNGs."""
 
-import subprocess
 from pathlib import Path
 
 import click
 
+# Named colors shared by backgrounds and foreground text (hex without #)
+NAMED_COLORS = {
+    "skin": "FCEDDB",
+    "matteblack": "1a1a1a",
+    "black": "000000",
+    "white": "FFFFFF",
+    "maroon": "B62F54",  # RGB(182, 47, 84)
+}
+
 
 def generate_bg_png(
     output_path: Path,
     color: str = "skin",
     dpi: int = 320,
 ) -> Path:
-    """Generate background PNG from LaTeX code.
+    """Generate a 5x5 inch solid-color background PNG.
     
     Args:
         output_path: Output PNG path
@@ -21,88 +29,25 @@ def generate_bg_png(
     Returns:
         Path to generated PNG
     """
-    # Generate LaTeX code on the fly
+    from PIL import Image
+    
     if color.startswith("#"):
         # Hex color
         hex_color = color.lstrip("#")
-        color_def = f"\\definecolor{{bgcol}}{{HTML}}{{{hex_color}}}"
     else:
         # Named color
-        color_map = {
-            "skin": "FCEDDB",
-            "matteblack": "1a1a1a",
-            "black": "000000",
-            "white": "FFFFFF",
-            "maroon": "B62F54",  # RGB(182, 47, 84)
-        }
-        hex_color = color_map.get(color.lower(), "FCEDDB")
-        color_def = f"\\definecolor{{bgcol}}{{HTML}}{{{hex_color}}}"
-    
-    latex_content = f"""\\documentclass{{article}}
-
-% Same dimensions as post.sty
-\\usepackage[paperwidth=5in, paperheight=5in, margin=0in]{{geometry}}
-\\usepackage{{xcolor}}
-\\usepackage{{pagecolor}}
-
-% Define background color
-{color_def}
-
-% Set page color
-\\pagecolor{{bgcol}}
-
-% Remove page numbers
-\\pagestyle{{empty}}
-
-\\begin{{document}}
-
-% Empty page with just the background color
-~
-
-\\end{{document}}
-"""
+        hex_color = NAMED_COLORS.get(color.lower(), NAMED_COLORS["skin"])
     
-    # Create temp directory for compilation
-    temp_dir = output_path.parent / ".bg_temp"
-    temp_dir.mkdir(exist_ok=True)
-    
-    # Write LaTeX file
-    temp_tex = temp_dir / "bg.tex"
-    temp_tex.write_text(latex_content)
-    
-    # Compile LaTeX
-    click.echo(f"  Compiling background...")
-    result = subprocess.run(
-        ["pdflatex", "-interaction=nonstopmode", "bg.tex"],
-        cwd=temp_dir,
-        capture_output=True,
-        text=True,
-    )
-    
-    pdf_path = temp_dir / "bg.pdf"
-    if not pdf_path.exists():
-        raise click.ClickException(f"Failed to compile background:\n{result.stderr}")
-    
-    # Convert PDF to PNG using PyMuPDF
-    import fitz
-    from PIL import Image
-    
-    doc = fitz.open(str(pdf_path))
-    zoom = dpi / 72
-    matrix = fitz.Matrix(zoom, zoom)
-    
-    page = doc[0]
-    pix = page.get_pixmap(matrix=matrix, alpha=False)
-    img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-    
-    doc.close()
-    
-    # Save PNG
-    img.save(output_path, "PNG")
-    
-    # Cleanup temp files
-    import shutil
-    shutil.rmtree(temp_dir)
+    try:
+        if len(hex_color) != 6:
+            raise ValueError(hex_color)
+        rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    except ValueError:
+        raise click.ClickException(f"Invalid color: {color}")
+    
+    # Same dimensions as post.sty (5in x 5in)
+    size = int(5 * dpi)
+    Image.new("RGB", (size, size), rgb).save(output_path, "PNG", compress_level=1)
     
     return output_path
 
@@ -55,6 +55,10 @@ ALL_THEMES = {**LIGHT_THEMES, **DARK_THEMES}
 # Default theme
 DEFAULT_THEME = "xcode"
 
+# Numbered lookup (1-based, in listing order) and dark-theme membership
+_THEME_LIST = tuple(ALL_THEMES.values())
+_DARK_SET = frozenset(DARK_THEMES.values())
+
 
 def get_theme(name_or_number: str | int) -> str:
     """Get theme name from string name or number.
@@ -70,29 +74,21 @@ def get_theme(name_or_number: str | int) -> str:
         get_theme(1) -> "xcode"
         get_theme("5") -> "tango"
     """
-    # If it's a number or numeric string, use indexed lookup
-    try:
-        idx = int(name_or_number)
-        theme_list = list(ALL_THEMES.keys())
-        if 1 <= idx <= len(theme_list):
-            return ALL_THEMES[theme_list[idx - 1]]
-        else:
-            raise ValueError(f"Theme number must be between 1 and {len(theme_list)}")
-    except (ValueError, TypeError):
-        pass
+    name = str(name_or_number).strip()
     
-    # Otherwise treat as theme name
-    name = str(name_or_number).lower()
-    if name in ALL_THEMES:
-        return ALL_THEMES[name]
+    # If it's a number or numeric string, use indexed lookup
+    if name.isdecimal():
+        idx = int(name)
+        if 1 <= idx <= len(_THEME_LIST):
+            return _THEME_LIST[idx - 1]
     
-    # Fallback to default
-    return DEFAULT_THEME
+    # Otherwise treat as theme name, falling back to the default
+    return ALL_THEMES.get(name.lower(), DEFAULT_THEME)
 
 
 def is_dark_theme(theme: str) -> bool:
     """Check if theme is dark."""
-    return theme in DARK_THEMES.values()
+    return theme in _DARK_SET
 
 
 def list_themes() -> str:
@@ -3,10 +3,12 @@
 import subprocess
 from datetime import date
 from pathlib import Path
+from string import Template
 
 import click
-import yaml
 
+from ..agents.debug import debug_enabled, log_debug
+from ..common.yaml_utils import yaml_classes
 from ..post.create import get_posts_dir
 from .templates import (
     assemble_modular_document,
@@ -38,20 +40,28 @@ LATEX_TEMPLATE = r"""\documentclass[border=0pt]{{standalone}}
 \end{{document}}
 """
 
-SLIDE_TEMPLATE = r"""% Slide {num}: {title}
-\begin{{tikzpicture}}[remember picture, overlay]
+SLIDE_TEMPLATE = Template(r"""% Slide $num: $title
+\begin{tikzpicture}[remember picture, overlay]
     \fill[bg] (current page.south west) rectangle (current page.north east);
-\end{{tikzpicture}}
+\end{tikzpicture}
 
-\begin{{minipage}}[c][5in][c]{{4.4in}}
+\begin{minipage}[c][5in][c]{4.4in}
     \centering
-    {{\Large\bfseries\color{{primary}} {title}}}
+    {\Large\bfseries\color{primary} $title}
     
-    \vspace{{0.3in}}
+    \vspace{0.3in}
     
-    {{\color{{primary}} {content}}}
-\end{{minipage}}
-"""
+    {\color{primary} $content}
+\end{minipage}
+""")
+
+# Basic escaping - might need more
+_TEX_ESCAPE = str.maketrans({"&": r"\&", "%": r"\%"})
+
+
+def _escape_latex(text: str) -> str:
+    """Escape the LaTeX special characters slide content commonly contains."""
+    return text.translate(_TEX_ESCAPE)
 
 
 def content_plan_to_latex(plan, code_slide: str | None = None) -> str:
@@ -61,22 +71,10 @@ def content_plan_to_latex(plan, code_slide: str | None = None) -> str:
         plan: The content plan with slides (ContentPlan from content_planner)
         code_slide: Optional code slide LaTeX to append
     """
-    slides_latex = []
-    
-    for i, slide in enumerate(plan.slides, 1):
-        # Escape special LaTeX characters in content
-        content = slide.content
-        # Basic escaping - might need more
-        content = content.replace("&", r"\&")
-        content = content.replace("%", r"\%")
-        content = content.replace("$", r"\$") if "$" not in content else content
-        
-        slide_latex = SLIDE_TEMPLATE.format(
-            num=i,
-            title=slide.title,
-            content=content,
-        )
-        slides_latex.append(slide_latex)
+    slides_latex = [
+        SLIDE_TEMPLATE.substitute(num=i, title=slide.title, content=_escape_latex(slide.content))
+        for i, slide in enumerate(plan.slides, 1)
+    ]
     
     # Add code slide if provided
     if code_slide:
@@ -121,9 +119,6 @@ def create_post_folder(
     post_path.mkdir(parents=True)
     (post_path / "images").mkdir()
     
-    # Write main.tex
-    (post_path / "main.tex").write_text(latex_content)
-    
     # Write code file if provided
     if code_file:
         lang, code = code_file
@@ -134,16 +129,14 @@ def create_post_folder(
         code_slide = create_code_slide_from_file(lang)
         (post_path / f"code_{lang}.tex").write_text(code_slide)
         
-        # Append code slide to main.tex
-        with open(post_path / "main.tex", "r") as f:
-            content = f.read()
-        
-        # Insert before \end{document}
-        content = content.replace(
+        # Append code slide to main.tex, before \end{document}
+        latex_content = latex_content.replace(
             r"\end{document}",
             f"\n\\newpage\n\n\\input{{code_{lang}}}\n\n\\end{{document}}"
         )
-        (post_path / "main.tex").write_text(content)
+    
+    # Write main.tex
+    (post_path / "main.tex").write_text(latex_content)
     
     # Write post.yaml
     yaml_content = {
@@ -154,8 +147,11 @@ def create_post_folder(
     if code_file:
         yaml_content["datamodel"] = f"datamodel.{get_code_file_extension(code_file[0])}"
     
+    import yaml
+    
+    _, dumper = yaml_classes()
     with open(post_path / "post.yaml", "w") as f:
-        yaml.dump(yaml_content, f, default_flow_style=False, allow_unicode=True)
+        yaml.dump(yaml_content, f, Dumper=dumper, default_flow_style=False, allow_unicode=True)
     
     return post_path
 
@@ -165,12 +161,17 @@ def render_latex(post_path: Path) -> bool:
     try:
         # Compile LaTeX with shell-escape for minted
         click.echo("  Compiling LaTeX...")
+        dbg = debug_enabled()
+        output = {"capture_output": True, "text": True} if dbg else {"stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL}
         result = subprocess.run(
             ["pdflatex", "-shell-escape", "-interaction=nonstopmode", "main.tex"],
             cwd=post_path,
-            capture_output=True,
+            stdin=subprocess.DEVNULL,
             timeout=60,
+            **output,
         )
+        if dbg:
+            log_debug("pdflatex", {"returncode": result.returncode, "output": result.stdout[-2000:]})
         
         if not (post_path / "main.pdf").exists():
             click.echo("  ⚠️  LaTeX compilation failed")
@@ -204,6 +205,117 @@ def render_latex(post_path: Path) -> bool:
         return False
 
 
+# Slide geometry for the fast renderer, in points (matches SLIDE_TEMPLATE)
+_PAGE_SIZE = 360  # 5in
+_TEXT_WIDTH = 316.8  # 4.4in minipage
+_TITLE_GAP = 21.6  # \vspace{0.3in}
+_TITLE_SIZE = 14.4  # \Large
+_BODY_SIZE = 10
+_PRIMARY_RGB = (0x1a / 255, 0x1a / 255, 0x1a / 255)
+
+
+def _fast_drawable(text: str) -> bool:
+    """Whether the base-14 fonts can draw text: no math/commands, Latin-1 only."""
+    if "$" in text or "\\" in text:
+        return False
+    try:
+        text.encode("latin-1")
+    except UnicodeEncodeError:
+        # θ, →, ² and friends would come out as missing glyphs
+        return False
+    return True
+
+
+def needs_latex(plan) -> bool:
+    """Whether any slide uses math, LaTeX commands or characters the fast renderer can't draw."""
+    return not all(
+        _fast_drawable(text)
+        for slide in plan.slides
+        for text in (slide.title, slide.content)
+    )
+
+
+def _text_height(fitz, text: str, fontsize: float, fontname: str) -> float:
+    """Height a centered text box needs at the slide text width."""
+    scratch = fitz.open()
+    page = scratch.new_page(width=_TEXT_WIDTH, height=10_000)
+    spare = page.insert_textbox(
+        fitz.Rect(0, 0, _TEXT_WIDTH, 10_000), text,
+        fontsize=fontsize, fontname=fontname, align=fitz.TEXT_ALIGN_CENTER,
+    )
+    scratch.close()
+    return 10_000 - spare
+
+
+def _block_top(title_h: float, body_h: float) -> float:
+    """Top of the title so the title, gap and body are centered vertically."""
+    return max((_PAGE_SIZE - title_h - _TITLE_GAP - body_h) / 2, 0)
+
+
+def render_slides_fast(plan, post_path: Path) -> bool:
+    """Draw plain-text slides straight to main.pdf with PyMuPDF and convert to PNGs.
+    
+    Skips pdflatex entirely, so it only suits slides without math, code or
+    other LaTeX markup (see needs_latex). main.tex is still written for
+    later editing and a full `assemble -r` render.
+    
+    Args:
+        plan: The content plan with slides (ContentPlan from content_planner)
+        post_path: Post directory
+        
+    Returns:
+        True if images were created
+    """
+    try:
+        import fitz
+        
+        click.echo("  Drawing slides...")
+        doc = fitz.open()
+        left = (_PAGE_SIZE - _TEXT_WIDTH) / 2
+        for slide in plan.slides:
+            page = doc.new_page(width=_PAGE_SIZE, height=_PAGE_SIZE)
+            
+            # Title and body stacked as one block, centered vertically
+            title_h = _text_height(fitz, slide.title, _TITLE_SIZE, "hebo")
+            body_h = _text_height(fitz, slide.content, _BODY_SIZE, "helv")
+            top = _block_top(title_h, body_h)
+            
+            page.insert_textbox(
+                fitz.Rect(left, top, left + _TEXT_WIDTH, top + title_h), slide.title,
+                fontsize=_TITLE_SIZE, fontname="hebo", color=_PRIMARY_RGB,
+                align=fitz.TEXT_ALIGN_CENTER,
+            )
+            top += title_h + _TITLE_GAP
+            page.insert_textbox(
+                fitz.Rect(left, top, left + _TEXT_WIDTH, _PAGE_SIZE), slide.content,
+                fontsize=_BODY_SIZE, fontname="helv", color=_PRIMARY_RGB,
+                align=fitz.TEXT_ALIGN_CENTER,
+            )
+        
+        pdf_path = post_path / "main.pdf"
+        doc.save(str(pdf_path))
+        doc.close()
+        
+        click.echo("  Converting to PNG...")
+        from .render import render_pdf_to_pngs
+        
+        paths = render_pdf_to_pngs(
+            pdf_path=pdf_path,
+            output_dir=post_path / "images",
+            dpi=300,
+        )
+        
+        if paths:
+            click.echo(f"  ✓ Created {len(paths)} image(s)")
+            return True
+        click.echo("  ⚠️  No images created")
+        return False
+    
+    except Exception as e:
+        click.echo(f"  ⚠️  Render failed: {e}")
+        return False
+
+
 @click.command(name="generate")
 @click.option("--idea", "-i", required=True, help="Topic or idea for the post")
 @click.option("--slides", "-s", type=int, default=None, help="Target number of slides")
@@ -211,7 +323,8 @@ def render_latex(post_path: Path) -> bool:
 @click.option("--name", "-n", help="Override folder name")
 @click.option("--code", "-c", type=click.Choice(["rust", "python", "swift"]), 
               help="Include data model code slide in specified language")
-def generate(idea: str, slides: int | None, render: bool, name: str | None, code: str | None) -> None:
+@click.option("--fast", is_flag=True, help="Render plain-text slides without LaTeX (falls back for math/code)")
+def generate(idea: str, slides: int | None, render: bool, name: str | None, code: str | None, fast: bool) -> None:
     """Generate a complete social media post from an idea.
     
     This command uses AI to:
@@ -225,6 +338,7 @@ def generate(idea: str, slides: int | None, render: bool, name: str | None, code
         vbsocial generate -i "projectile motion basics"
         vbsocial generate -i "pursuit problem kinematics" -s 4 -r
         vbsocial generate -i "Newton's laws" --code rust -r
+        vbsocial generate -i "units of force" -r --fast
     """
     click.echo(f"\n🚀 Generating post for: {idea}")
     click.echo("=" * 50)
@@ -276,7 +390,12 @@ def generate(idea: str, slides: int | None, render: bool, name: str | None, code
     # Step 6: Optionally render
     if render:
         click.echo("\n🖼️  Rendering images...")
-        render_latex(post_path)
+        if fast and not code_slide_file and not needs_latex(plan):
+            render_slides_fast(plan, post_path)
+        else:
+            if fast:
+                click.echo("  Slides need LaTeX (math or code), using pdflatex")
+            render_latex(post_path)
     
     # Summary
     click.echo("\n" + "=" * 50)
@@ -5,8 +5,8 @@ from datetime import date
 from pathlib import Path
 
 import click
-import yaml
 
+from ..common.yaml_utils import yaml_classes
 from ..post.create import get_posts_dir
 from .templates import (
     assemble_modular_document,
@@ -15,6 +15,7 @@ from .templates import (
     get_code_file_extension,
     replace_item_with_lambda,
     has_diagram_reference,
+    mentions_diagram,
 )
 
 
@@ -208,7 +209,7 @@ def create_post_from_image(
         try:
             from ..agents.tikz import generate_tikz
             # Check if source image has a diagram
-            has_diagram = any(kw in problem.lower() for kw in ["diagram", "figure", "shown", "given", "cylindrical", "piston"])
+            has_diagram = mentions_diagram(problem)
             tikz_code = generate_tikz(
                 problem=problem,
                 solution=solution,
@@ -295,8 +296,11 @@ def create_post_from_image(
         "source_images": [str(p) for p in image_paths],
         "components": components,
     }
+    import yaml
+    
+    _, dumper = yaml_classes()
     with open(post_path / "post.yaml", "w") as f:
-        yaml.dump(yaml_content, f, default_flow_style=False, allow_unicode=True)
+        yaml.dump(yaml_content, f, Dumper=dumper, default_flow_style=False, allow_unicode=True)
     
     return post_path
 
@@ -348,7 +352,8 @@ def from_image(image_paths: tuple[str, ...], idea: bool, alternate: bool, code:
             subprocess.run(
                 ["pdflatex", "-shell-escape", "-interaction=nonstopmode", "main.tex"],
                 cwd=post_path,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
             
             # Render PDF to PNG
@@ -159,6 +159,67 @@ def create_blurred_version(
     return blurred
 
 
+def _compose_page(
+    page: Image.Image,
+    i: int,
+    output_dir: Path,
+    blur: bool,
+    blur_radius: int,
+    blur_opacity: float,
+    blur_offset: tuple[int, int],
+    bg_image: Image.Image | None,
+    bg_color: tuple[int, int, int] | None,
+    prefix: str,
+    debug_dir: Path | None,
+) -> Path:
+    """Blur, stack and save one rendered page, returning the PNG path.
+
+    The page is stacked on bg_image (resized to the page) when given, else on a
+    solid bg_color canvas; with neither it is saved transparent.
+    """
+    # Stage 1: Original (no blur, no bg)
+    original = page.copy()
+    if debug_dir:
+        original.save(debug_dir / f"{prefix}-{i}_1_original.png", "PNG")
+
+    # Stage 2: Create blurred version of original image
+    blurred_original = None
+    if blur:
+        blurred_original = create_blurred_version(
+            page,
+            blur_radius=blur_radius,
+            blur_opacity=blur_opacity,
+        )
+        if debug_dir:
+            blurred_original.save(debug_dir / f"{prefix}-{i}_2_blurred.png", "PNG")
+
+    # Stage 3: Stack on background: bg + blurred_original (offset) + original (centered)
+    final = original
+    if bg_image or bg_color:
+        # Create background canvas
+        if bg_image:
+            bg_resized = bg_image.resize((original.width, original.height), Image.Resampling.LANCZOS)
+            canvas = bg_resized.convert("RGBA")
+        else:
+            canvas = Image.new("RGBA", original.size, (*bg_color, 255))
+        
+        # Stack: blurred original (with offset) then sharp original (centered)
+        if blur and blurred_original:
+            canvas.paste(blurred_original, blur_offset, blurred_original)
+        canvas.paste(original, (0, 0), original)
+        final = canvas
+
+    # Save final
+    output_path = output_dir / f"{prefix}-{i}.png"
+    final.save(output_path, "PNG")
+
+    if debug_dir:
+        # Also save as stage 3
+        final.save(debug_dir / f"{prefix}-{i}_3_final.png", "PNG")
+
+    return output_path
+
+
 def render_pdf_to_pngs(
     pdf_path: Path,
     output_dir: Path,
@@ -177,7 +238,7 @@ def render_pdf_to_pngs(
     Pipeline:
     1. PDF -> PNG (transparent background) = original
     2. Blur the original image = blurred_original
-    3. Generate background PNG from bg.tex if not provided
+    3. Background: the --bg image, else a solid bg_color, else the skin PNG from generate_bg_png
     4. Stack: bg + blurred_original (offset 5px,5px) + original (centered, no offset)
 
     Args:
@@ -209,48 +270,24 @@ def render_pdf_to_pngs(
     # Convert PDF to images
     pages = pdf_to_images(pdf_path, dpi=dpi)
 
-    output_paths = []
-    for i, page in enumerate(pages, 1):
-        # Stage 1: Original (no blur, no bg)
-        original = page.copy()
-        if debug:
-            original.save(debug_dir / f"{prefix}-{i}_1_original.png", "PNG")
-
-        # Stage 2: Create blurred version of original image
-        blurred_original = None
-        if blur:
-            blurred_original = create_blurred_version(
-                page,
-                blur_radius=blur_radius,
-                blur_opacity=blur_opacity,
-            )
-            if debug:
-                blurred_original.save(debug_dir / f"{prefix}-{i}_2_blurred.png", "PNG")
-
-        # Stage 3: Stack on background: bg + blurred_original (offset) + original (centered)
-        final = original
-        if bg_image or bg_color:
-            # Create background canvas
-            if bg_image:
-                bg_resized = bg_image.resize((original.width, original.height), Image.Resampling.LANCZOS)
-                canvas = bg_resized.convert("RGBA")
-            else:
-                canvas = Image.new("RGBA", original.size, (*bg_color, 255))
-            
-            # Stack: blurred original (with offset) then sharp original (centered)
-            if blur and blurred_original:
-                canvas.paste(blurred_original, blur_offset, blurred_original)
-            canvas.paste(original, (0, 0), original)
-            final = canvas
+    # Rasterization stays on this thread (a fitz document is not thread-safe);
+    # blurring, compositing and PNG encoding run per page on a pool since
+    # Pillow releases the GIL for the heavy parts.
+    if bg_image:
+        bg_image.load()
 
-        # Save final
-        output_path = output_dir / f"{prefix}-{i}.png"
-        final.save(output_path, "PNG")
-        output_paths.append(output_path)
+    def compose(i: int, page: Image.Image) -> Path:
+        return _compose_page(
+            page, i, output_dir, blur, blur_radius, blur_opacity, blur_offset,
+            bg_image, bg_color, prefix, debug_dir,
+        )
 
-        if debug:
-            # Also save as stage 3
-            final.save(debug_dir / f"{prefix}-{i}_3_final.png", "PNG")
+    if len(pages) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(8, len(pages))) as pool:
+            output_paths = list(pool.map(compose, range(1, len(pages) + 1), pages))
+    else:
+        output_paths = [compose(i, page) for i, page in enumerate(pages, 1)]
 
     # Cleanup temp background
     bg_temp = output_dir / ".bg_temp.png"
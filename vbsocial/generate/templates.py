@@ -1,5 +1,7 @@
 """LaTeX templates for social media posts."""
 
+import re
+
 # Main template with minted support for code highlighting (pdflatex compatible)
 MAIN_TEMPLATE = r"""\documentclass[border=0pt]{{standalone}}
 \usepackage[paperwidth=5in, paperheight=5in, margin=0.25in]{{geometry}}
@@ -143,6 +145,21 @@ def has_diagram_reference(content: str) -> bool:
     return r"\input{diagram}" in content or r"\include{diagram}" in content
 
 
+# Component names that are data model languages
+CODE_LANGS = frozenset({"rust", "python", "swift", "c", "zig", "go", "cpp"})
+
+# Document order of the enumerate components
+_ENUM_RANK = {"problem": 0, "idea": 1, "solution": 2, "alternate": 3}
+
+# Words suggesting a problem comes with a figure; one case-insensitive scan
+_DIAGRAM_WORDS_RE = re.compile(r"diagram|figure|shown|given|cylindrical|piston", re.IGNORECASE)
+
+
+def mentions_diagram(content: str) -> bool:
+    """Check if content talks about a figure (diagram, shown, given, ...)."""
+    return _DIAGRAM_WORDS_RE.search(content) is not None
+
+
 def create_code_slide(code: str, language: str) -> str:
     """Create raw minted code block."""
     return CODE_SLIDE_TEMPLATE.format(
@@ -405,15 +422,12 @@ def assemble_modular_document(components: list[str], title: str = "PHYSICS", pos
     """
     from pathlib import Path
     
-    # Define the correct order
-    ORDER = ["problem", "idea", "solution", "alternate"]
-    
     enum_parts = []
     code_langs = []
     has_diagram = "diagram" in components
     
     for comp in components:
-        if comp in ("rust", "python", "swift", "c", "zig", "go", "cpp"):
+        if comp in CODE_LANGS:
             code_langs.append(comp)
         elif comp.startswith("code_"):
             code_langs.append(comp.replace("code_", ""))
@@ -423,8 +437,8 @@ def assemble_modular_document(components: list[str], title: str = "PHYSICS", pos
         else:
             enum_parts.append(comp)
     
-    # Sort enum_parts by ORDER
-    enum_parts_sorted = sorted(enum_parts, key=lambda x: ORDER.index(x) if x in ORDER else 99)
+    # Sort enum_parts into document order
+    enum_parts_sorted = sorted(enum_parts, key=lambda x: _ENUM_RANK.get(x, 99))
     
     # If diagram exists, append it to problem.tex
     if has_diagram and post_path:
@@ -5,7 +5,6 @@ from datetime import date
 from pathlib import Path
 
 import click
-import yaml
 
 
 LATEX_TEMPLATE = r"""\documentclass[border=0pt]{standalone}
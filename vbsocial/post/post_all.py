@@ -4,13 +4,13 @@ import webbrowser
 from pathlib import Path
 
 import click
-import yaml
 
 from ..facebook.commands.photo import post_photo as fb_post_photo, post_multiple_photos as fb_post_multiple
 from ..instagram.commands.photo import post_photo as ig_post_photo, post_carousel as ig_post_carousel
 from ..linkedin.linkedinpost import LinkedInPost
 from ..x.auth import create_oauth_session
 from ..x.functions import upload_image, create_tweet
+from ..common.yaml_utils import yaml_classes
 
 
 PLATFORMS = ["facebook", "instagram", "linkedin", "x", "youtube"]
@@ -22,8 +22,20 @@ def load_post_config(post_path: Path) -> dict:
     if not yaml_path.exists():
         raise click.ClickException(f"post.yaml not found in {post_path}")
     
+    import yaml
+    
+    loader, _ = yaml_classes()
     with open(yaml_path) as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=loader)
+
+
+def save_post_config(post_path: Path, config: dict) -> None:
+    """Write config back to the post folder's post.yaml."""
+    import yaml
+    
+    _, dumper = yaml_classes()
+    with open(post_path / "post.yaml", "w") as f:
+        yaml.dump(config, f, Dumper=dumper, default_flow_style=False, allow_unicode=True)
 
 
 def get_images(post_path: Path) -> list[Path]:
@@ -193,9 +205,7 @@ def post_all(post_path: Path, skip: tuple, dry_run: bool) -> None:
     # Save post IDs to post.yaml
     if post_ids:
         config["post_ids"] = post_ids
-        yaml_path = post_path / "post.yaml"
-        with open(yaml_path, "w") as f:
-            yaml.dump(config, f, default_flow_style=False, allow_unicode=True)
+        save_post_config(post_path, config)
         click.echo(f"\n📝 Saved post IDs to post.yaml")
     
     click.echo("\n✅ Done!")
@@ -208,7 +218,7 @@ def post_all(post_path: Path, skip: tuple, dry_run: bool) -> None:
 
 def delete_from_facebook(post_id: str) -> bool:
     """Delete a post from Facebook."""
-    from ..facebook.auth import get_access_token, API_VERSION
+    from ..facebook.auth import get_access_token, GRAPH_BASE
     from ..common.http import get_session, DEFAULT_TIMEOUT
     
     click.echo(f"\n📘 Deleting from Facebook (ID: {post_id})...")
@@ -217,7 +227,7 @@ def delete_from_facebook(post_id: str) -> bool:
     token = get_access_token()
     
     resp = session.delete(
-        f"https://graph.facebook.com/{API_VERSION}/{post_id}",
+        f"{GRAPH_BASE}/{post_id}",
         params={"access_token": token},
         timeout=DEFAULT_TIMEOUT,
     )
@@ -396,9 +406,7 @@ def delete_all(post_path: Path, skip: tuple, confirm: bool, dry_run: bool) -> No
         else:
             del config["post_ids"]
         
-        yaml_path = post_path / "post.yaml"
-        with open(yaml_path, "w") as f:
-            yaml.dump(config, f, default_flow_style=False, allow_unicode=True)
+        save_post_config(post_path, config)
         
         click.echo(f"\n📝 Updated post.yaml (removed deleted IDs)")
     
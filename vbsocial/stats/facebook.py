@@ -2,7 +2,7 @@
 
 import click
 
-from ..facebook.auth import get_access_token, load_config, API_VERSION
+from ..facebook.auth import get_access_token, load_config, GRAPH_BASE
 from ..common.http import get_session, DEFAULT_TIMEOUT
 
 
@@ -16,7 +16,7 @@ def get_page_info() -> dict:
     if not page_id:
         raise click.ClickException("No page_id in config. Run 'vbsocial facebook configure'")
     
-    page_url = f"https://graph.facebook.com/{API_VERSION}/{page_id}"
+    page_url = f"{GRAPH_BASE}/{page_id}"
     page_resp = session.get(
         page_url,
         params={
@@ -36,7 +36,7 @@ def get_recent_posts(limit: int = 10) -> list:
     page_id = config.get("page_id")
     session = get_session()
     
-    posts_url = f"https://graph.facebook.com/{API_VERSION}/{page_id}/posts"
+    posts_url = f"{GRAPH_BASE}/{page_id}/posts"
     posts_resp = session.get(
         posts_url,
         params={